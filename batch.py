@@ -0,0 +1,142 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+
+from models import Bill, Legislator, DatasetSummary
+from repositories import LegislatorsRepository, SharedReferenceTables, SharedReferenceTablesDescriptor
+from services import legislators_support_oppose_count, bills_support_oppose_count
+
+
+LEGISLATORS_OUTPUT_FILE = "legislators-support-oppose-count.csv"
+BILLS_OUTPUT_FILE = "bills.csv"
+SUMMARY_OUTPUT_FILE = "summary.csv"
+
+# Reference tables rebuilt once per worker process by _init_worker
+_legislators: List[Legislator] = []
+_bills: List[Bill] = []
+
+
+def _init_worker(descriptor: SharedReferenceTablesDescriptor) -> None:
+    """Attach to the shared reference tables and rebuild the records once per worker"""
+    global _legislators, _bills
+    tables = SharedReferenceTables.attach(descriptor)
+    try:
+        _legislators = tables.get_all_legislators()
+        _bills = tables.get_all_bills()
+    finally:
+        tables.close()
+
+
+def process_dataset(name: str, input_dir: str, output_dir: str) -> DatasetSummary:
+    """
+    Run the support/oppose reports for a single dataset directory
+
+    Args:
+        name: Dataset name used in the combined summary
+        input_dir: Directory containing votes.csv and vote_results.csv
+        output_dir: Directory where the dataset reports are written
+
+    Returns:
+        DatasetSummary with the row counts and vote totals of the dataset
+    """
+    repository = LegislatorsRepository(
+        datasets_input_path=input_dir,
+        datasets_output_path=output_dir
+    )
+    votes = repository.get_all_votes()
+    vote_results = repository.get_all_vote_results()
+
+    legislators_count = legislators_support_oppose_count(_legislators, vote_results)
+    repository.save_legislator_vote_counts(legislators_count, LEGISLATORS_OUTPUT_FILE)
+
+    bills_count = bills_support_oppose_count(_bills, votes, vote_results, _legislators)
+    repository.save_bill_vote_counts(bills_count, BILLS_OUTPUT_FILE)
+
+    return DatasetSummary(
+        name=name,
+        total_bills=len(_bills),
+        total_legislators=len(_legislators),
+        total_votes=len(votes),
+        total_vote_results=len(vote_results),
+        total_supported=sum(count.num_supported_bills for count in legislators_count),
+        total_opposed=sum(count.num_opposed_bills for count in legislators_count)
+    )
+
+
+def run_batch(
+    input_dirs: List[str],
+    reference_dir: str = "datasets/input",
+    output_dir: str = "datasets/output/batch",
+    workers: Optional[int] = None
+) -> List[DatasetSummary]:
+    """
+    Process many dataset directories through a worker pool
+
+    The legislator and bill tables are read once from reference_dir and
+    shared with the workers through shared memory.
+
+    Args:
+        input_dirs: Dataset directories, each with votes.csv and vote_results.csv
+        reference_dir: Directory containing legislators.csv and bills.csv
+        output_dir: Root output directory; each dataset gets a subdirectory
+            named after its input directory, plus a combined summary.csv
+        workers: Number of worker processes (default: os.cpu_count())
+
+    Returns:
+        List of DatasetSummary instances in the order of input_dirs
+    """
+    names = [Path(input_dir).name for input_dir in input_dirs]
+    if len(set(names)) != len(names):
+        raise ValueError("Input directories must have distinct names")
+
+    reference_repository = LegislatorsRepository(datasets_input_path=reference_dir)
+    legislators = reference_repository.get_all_legislators()
+    bills = reference_repository.get_all_bills()
+
+    output_root = Path(output_dir)
+    with SharedReferenceTables.create(legislators, bills) as tables:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(tables.descriptor,)
+        ) as executor:
+            summaries = list(executor.map(
+                process_dataset,
+                names,
+                input_dirs,
+                [str(output_root / name) for name in names]
+            ))
+
+    LegislatorsRepository(datasets_output_path=output_dir).save_dataset_summaries(
+        summaries, SUMMARY_OUTPUT_FILE
+    )
+    return summaries
+
+
+def main(argv: Optional[List[str]] = None):
+    """Batch entry point processing several dataset directories"""
+    parser = argparse.ArgumentParser(description="Process many legislator datasets in parallel")
+    parser.add_argument("input_dirs", nargs="+", help="Dataset directories to process")
+    parser.add_argument("--reference-dir", default="datasets/input",
+                        help="Directory containing legislators.csv and bills.csv")
+    parser.add_argument("--output-dir", default="datasets/output/batch",
+                        help="Root directory for the per-dataset reports and summary")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of worker processes")
+    args = parser.parse_args(argv)
+
+    summaries = run_batch(args.input_dirs, args.reference_dir, args.output_dir, args.workers)
+
+    print("\n" + "=" * 60)
+    print("BATCH SUMMARY")
+    print("=" * 60)
+    for summary in summaries:
+        print(
+            f"{summary.name}: {summary.total_vote_results} vote results, "
+            f"{summary.total_supported} supported, {summary.total_opposed} opposed"
+        )
+
+
+if __name__ == "__main__":
+    main()
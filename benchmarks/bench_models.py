@@ -0,0 +1,71 @@
+"""
+Construction time and memory of the record models
+
+Compares the slotted VoteResult built through from_rows against an
+equivalent dict-backed dataclass built with keyword arguments, which is
+how records were created before the compact layout. The dict-backed class
+is also built positionally, so the gain of positional construction and
+the gain of __slots__ are reported separately.
+
+Run from the repository root:
+    python -m benchmarks.bench_models [num_rows]
+"""
+import sys
+import timeit
+import tracemalloc
+from dataclasses import make_dataclass
+from itertools import starmap
+
+from models import VoteResult
+
+
+DictVoteResult = make_dataclass(
+    'DictVoteResult',
+    [('id', int), ('legislator_id', int), ('vote_id', int), ('vote_type', int)]
+)
+
+
+def _rows(num_rows: int):
+    return [(i, i % 435, i // 435, 1 + i % 2) for i in range(num_rows)]
+
+
+def build_dict_records(rows):
+    return [
+        DictVoteResult(id=a, legislator_id=b, vote_id=c, vote_type=d)
+        for a, b, c, d in rows
+    ]
+
+
+def build_dict_records_positional(rows):
+    return list(starmap(DictVoteResult, rows))
+
+
+def build_slotted_records(rows):
+    return VoteResult.from_rows(rows)
+
+
+def _measure_memory(builder, rows) -> int:
+    tracemalloc.start()
+    records = builder(rows)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return size
+
+
+def main(num_rows: int = 200_000):
+    rows = _rows(num_rows)
+
+    print(f"VoteResult construction, {num_rows} rows")
+    for label, builder in (
+        ("dict dataclass, keywords", build_dict_records),
+        ("dict dataclass, positional", build_dict_records_positional),
+        ("slotted, from_rows", build_slotted_records),
+    ):
+        seconds = min(timeit.repeat(lambda: builder(rows), number=1, repeat=5))
+        memory = _measure_memory(builder, rows)
+        print(f"  {label:<28} {seconds * 1000:8.1f} ms {memory / 1024 / 1024:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
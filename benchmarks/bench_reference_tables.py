@@ -0,0 +1,49 @@
+"""
+Worker startup cost of the reference tables: pickled initargs vs SharedReferenceTables
+
+Run from the repository root:
+    python -m benchmarks.bench_reference_tables [num_legislators] [num_bills]
+"""
+import pickle
+import sys
+import timeit
+
+from models import Bill, Legislator
+from repositories import SharedReferenceTables
+
+
+def main(num_legislators: int = 20_000, num_bills: int = 200_000):
+    legislators = Legislator.from_rows(
+        (i, f"Rep. Legislator {i} (D-NY-{i % 30})") for i in range(num_legislators)
+    )
+    bills = Bill.from_rows(
+        (i, f"H.R. {i}: Appropriations Act, {2000 + i % 25}", i % num_legislators)
+        for i in range(num_bills)
+    )
+    pickled = pickle.dumps((legislators, bills), pickle.HIGHEST_PROTOCOL)
+
+    def pickled_initargs():
+        pickle.loads(pickled)
+
+    def shared_tables():
+        attached = SharedReferenceTables.attach(pickle.loads(pickle.dumps(tables.descriptor)))
+        try:
+            attached.get_all_legislators()
+            attached.get_all_bills()
+        finally:
+            attached.close()
+
+    with SharedReferenceTables.create(legislators, bills) as tables:
+        pickled_seconds = min(timeit.repeat(pickled_initargs, number=1, repeat=5))
+        shared_seconds = min(timeit.repeat(shared_tables, number=1, repeat=5))
+
+    print(f"{num_legislators} legislators, {num_bills} bills, decoding per worker")
+    for label, seconds in (
+        ("pickled initargs", pickled_seconds),
+        ("shared reference tables", shared_seconds),
+    ):
+        print(f"  {label:<26} {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
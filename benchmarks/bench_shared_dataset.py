@@ -0,0 +1,47 @@
+"""
+Handoff cost of vote results to a worker: pickled records vs SharedDataset
+
+Run from the repository root:
+    python -m benchmarks.bench_shared_dataset [num_vote_results]
+"""
+import pickle
+import sys
+import timeit
+
+from models import VoteResult
+from repositories import SharedDataset
+from services import VoteTypeHistograms
+
+
+def main(num_vote_results: int = 500_000):
+    vote_results = VoteResult.from_rows(
+        (i, i % 535, i // 535, 1 + i % 2) for i in range(num_vote_results)
+    )
+
+    def pickled_handoff():
+        received = pickle.loads(pickle.dumps(vote_results, pickle.HIGHEST_PROTOCOL))
+        VoteTypeHistograms.from_vote_results(received)
+
+    def shared_handoff():
+        with SharedDataset.attach(pickle.loads(pickle.dumps(dataset.descriptor))) as attached:
+            VoteTypeHistograms.from_columns(
+                attached.column('legislator_id'),
+                attached.column('vote_id'),
+                attached.column('vote_type')
+            )
+
+    create_seconds = min(timeit.repeat(
+        lambda: SharedDataset.from_vote_results(vote_results).close(), number=1, repeat=3
+    ))
+    with SharedDataset.from_vote_results(vote_results) as dataset:
+        pickled_seconds = min(timeit.repeat(pickled_handoff, number=1, repeat=3))
+        shared_seconds = min(timeit.repeat(shared_handoff, number=1, repeat=3))
+
+    print(f"{num_vote_results} vote results, handoff + aggregation per worker")
+    print(f"  pickled records   {pickled_seconds * 1000:8.1f} ms")
+    print(f"  shared dataset    {shared_seconds * 1000:8.1f} ms")
+    print(f"  (one-time shared dataset creation {create_seconds * 1000:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
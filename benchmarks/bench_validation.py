@@ -0,0 +1,57 @@
+"""
+Cost of the validation pass relative to the aggregation services
+
+As in main.py, the histograms are counted once for both reports and the
+validation reuses them.
+
+Run from the repository root:
+    python -m benchmarks.bench_validation [num_vote_results]
+"""
+import sys
+import timeit
+
+from models import Bill, Legislator, Vote, VoteResult
+from services import (
+    legislators_support_oppose_count,
+    bills_support_oppose_count,
+    validate_dataset,
+    VoteTypeHistograms
+)
+
+
+def _dataset(num_vote_results: int):
+    num_legislators = 535
+    num_votes = max(num_vote_results // num_legislators, 1)
+    legislators = Legislator.from_rows((i, f"Rep. Legislator {i} (D-NY-{i})") for i in range(num_legislators))
+    bills = Bill.from_rows((i, f"H.R. {i}", i % num_legislators) for i in range(num_votes))
+    votes = Vote.from_rows((i, i) for i in range(num_votes))
+    vote_results = VoteResult.from_rows(
+        (i, i % num_legislators, i % num_votes, 1 + i % 2) for i in range(num_vote_results)
+    )
+    return bills, legislators, votes, vote_results
+
+
+def main(num_vote_results: int = 500_000):
+    bills, legislators, votes, vote_results = _dataset(num_vote_results)
+
+    def aggregate():
+        histograms = VoteTypeHistograms.from_vote_results(vote_results, votes, bills)
+        legislators_support_oppose_count(legislators, vote_results, histograms)
+        bills_support_oppose_count(bills, votes, vote_results, legislators, histograms)
+
+    histograms = VoteTypeHistograms.from_vote_results(vote_results, votes, bills)
+
+    def validate():
+        validate_dataset(bills, legislators, votes, vote_results, histograms)
+
+    aggregation_seconds = min(timeit.repeat(aggregate, number=1, repeat=3))
+    validation_seconds = min(timeit.repeat(validate, number=1, repeat=3))
+
+    print(f"{num_vote_results} vote results")
+    print(f"  aggregation {aggregation_seconds * 1000:8.1f} ms")
+    print(f"  validation  {validation_seconds * 1000:8.1f} ms "
+          f"({validation_seconds / aggregation_seconds:.0%} of aggregation)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
@@ -1,42 +1,213 @@
-from repositories import LegislatorsRepository
-from services import legislators_support_oppose_count, bills_support_oppose_count
+import argparse
+from typing import List, Optional
 
+from repositories import LegislatorsRepository, LazyDataset
+from services import (
+    legislators_support_oppose_count,
+    bills_support_oppose_count,
+    bills_support_oppose_count_by_group,
+    LegislatorGroups,
+    VoteTypeHistograms,
+    validate_dataset,
+    sort_report
+)
 
-def main():
-    """Main function to demonstrate repository usage"""
-    # Initialize the repository
-    repository = LegislatorsRepository()
-    
-    # Get all data from CSV files
-    bills = repository.get_all_bills()
-    legislators = repository.get_all_legislators()
-    vote_results = repository.get_all_vote_results()
-    votes = repository.get_all_votes()
-    
 
-    # Display summary statistics
+REPORTS = ('all', 'legislators', 'bills', 'summary')
+
+# Input tables each report reads
+REPORT_TABLES = {
+    'legislators': ('legislators', 'vote_results'),
+    'bills': ('bills', 'votes', 'vote_results', 'legislators'),
+}
+ALL_TABLES = ('bills', 'legislators', 'votes', 'vote_results')
+
+LEGISLATORS_OUTPUT_FILE = "legislators-support-oppose-count.csv"
+BILLS_OUTPUT_FILE = "bills.csv"
+
+# --sort-by choice -> (LegislatorVoteCount field, BillVoteCount field)
+SORT_FIELDS = {
+    'id': ('id', 'id'),
+    'supported': ('num_supported_bills', 'supporter_count'),
+    'opposed': ('num_opposed_bills', 'opposer_count'),
+}
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse the command line options of main"""
+    parser = argparse.ArgumentParser(description="Legislator and bill support/oppose reports")
+    parser.add_argument("--report", choices=REPORTS, default="all",
+                        help="Reports to generate; 'summary' only prints the row counts")
+    parser.add_argument("--validate", action="store_true",
+                        help="Validate referential integrity even when not all tables are needed")
+    parser.add_argument("--sort-by", choices=sorted(SORT_FIELDS),
+                        help="Sort the legislator and bill reports by id or by a count column")
+    parser.add_argument("--descending", action="store_true",
+                        help="Sort in descending order")
+    parser.add_argument("--partition-rows", type=int,
+                        help="Split the legislator and bill reports into files of at most this many rows, with a manifest")
+    return parser.parse_args(argv)
+
+
+def print_summary(dataset: LazyDataset) -> None:
+    """Print the row count of every table; tables not loaded are line counted"""
     print("\n" + "=" * 60)
     print("SUMMARY")
     print("=" * 60)
-    print(f"Total Bills: {len(bills)}")
-    print(f"Total Legislators: {len(legislators)}")
-    print(f"Total Votes: {len(votes)}")
-    print(f"Total Vote Results: {len(vote_results)}")
+    print(f"Total Bills: {dataset.row_count('bills')}")
+    print(f"Total Legislators: {dataset.row_count('legislators')}")
+    print(f"Total Votes: {dataset.row_count('votes')}")
+    print(f"Total Vote Results: {dataset.row_count('vote_results')}")
+
+
+def print_validation(dataset: LazyDataset, histograms: Optional[VoteTypeHistograms] = None) -> None:
+    """Flag referential-integrity issues before they skew the reports"""
+    validation_report = validate_dataset(
+        dataset.bills, dataset.legislators, dataset.votes, dataset.vote_results, histograms
+    )
+    if not validation_report.is_valid:
+        print("\n" + "=" * 60)
+        print("VALIDATION")
+        print("=" * 60)
+        print(f"Orphan Votes: {len(validation_report.orphan_votes)}")
+        print(f"Orphan Vote Results: {len(validation_report.orphan_vote_results)}")
+        print(f"Unknown Legislators: {len(validation_report.unknown_legislators)}")
+        print(f"Unknown Sponsors: {len(validation_report.unknown_sponsors)}")
+        print(f"Duplicate Vote Result Ids: {len(validation_report.duplicate_vote_result_ids)}")
+        print(f"Invalid Vote Types: {len(validation_report.invalid_vote_types)}")
 
 
+def run_legislators_report(
+    repository: LegislatorsRepository,
+    dataset: LazyDataset,
+    histograms: VoteTypeHistograms,
+    args: argparse.Namespace
+) -> None:
+    """Compute and persist the legislator reports; needs legislators and vote_results"""
+    sort_key = SORT_FIELDS[args.sort_by][0] if args.sort_by else None
+
     # execute the support count operation for legislators
-    legislators_count = legislators_support_oppose_count(legislators, vote_results)
+    legislators_count = legislators_support_oppose_count(
+        dataset.legislators, dataset.vote_results, histograms
+    )
+    if sort_key:
+        legislators_count = sort_report(legislators_count, sort_key, args.descending)
 
     # persist the support count data
-    repository.save_legislator_vote_counts(legislators_count)
+    if args.partition_rows:
+        repository.save_partitioned(
+            repository.save_legislator_vote_counts,
+            legislators_count,
+            LEGISLATORS_OUTPUT_FILE,
+            args.partition_rows,
+            sort_key
+        )
+    else:
+        repository.save_legislator_vote_counts(legislators_count, LEGISLATORS_OUTPUT_FILE)
+
+    # persist the extended report with every vote type
+    repository.save_vote_type_counts(
+        histograms.legislator_vote_type_counts(dataset.legislators),
+        histograms.labels,
+        "legislators-vote-types.csv"
+    )
+
+
+def run_bills_report(
+    repository: LegislatorsRepository,
+    dataset: LazyDataset,
+    histograms: VoteTypeHistograms,
+    args: argparse.Namespace
+) -> None:
+    """Compute and persist the bill reports; needs every table and histograms counted with groups"""
+    sort_key = SORT_FIELDS[args.sort_by][1] if args.sort_by else None
+    bills, votes, vote_results, legislators = (
+        dataset.bills, dataset.votes, dataset.vote_results, dataset.legislators
+    )
 
     # execute the support count operation for bills
-    bills_count = bills_support_oppose_count(bills, votes, vote_results, legislators)
+    bills_count = bills_support_oppose_count(bills, votes, vote_results, legislators, histograms)
+    if sort_key:
+        bills_count = sort_report(bills_count, sort_key, args.descending)
 
     # persist the bill vote count data
-    repository.save_bill_vote_counts(bills_count)
+    if args.partition_rows:
+        repository.save_partitioned(
+            repository.save_bill_vote_counts,
+            bills_count,
+            BILLS_OUTPUT_FILE,
+            args.partition_rows,
+            sort_key
+        )
+    else:
+        repository.save_bill_vote_counts(bills_count, BILLS_OUTPUT_FILE)
+
+    # persist the extended report with every vote type
+    repository.save_vote_type_counts(
+        histograms.bill_vote_type_counts(bills),
+        histograms.labels,
+        "bills-vote-types.csv",
+        name_field="title"
+    )
+
+    # break the bill counts down by party and state; both are views of the
+    # group cells counted in the same pass as the histograms
+    for dimension in ('party', 'state'):
+        bills_group_count = bills_support_oppose_count_by_group(
+            bills, votes, vote_results, histograms.groups, dimension, histograms
+        )
+        repository.save_bill_group_vote_counts(
+            bills_group_count, dimension, f"bills-by-{dimension}.csv"
+        )
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main function to demonstrate repository usage"""
+    args = parse_args(argv)
+    reports = ('legislators', 'bills') if args.report == 'all' else (args.report,)
+
+    # every table is loaded for 'all' anyway, so validation comes for free there
+    validate = args.report == 'all' or args.validate
+
+    # Initialize the repository; tables are read only when a report needs them
+    repository = LegislatorsRepository()
+    dataset = LazyDataset(repository)
+
+    # Load what the selected reports need up front, so the summary shows
+    # parsed row counts and only untouched tables are line counted
+    needed_tables = set(ALL_TABLES) if validate else set()
+    for report in reports:
+        needed_tables.update(REPORT_TABLES.get(report, ()))
+    dataset.load(table for table in ALL_TABLES if table in needed_tables)
+
+    # Display summary statistics
+    print_summary(dataset)
+
+    if 'legislators' not in reports and 'bills' not in reports:
+        if validate:
+            print_validation(dataset)
+        return
+
+    # count legislator x vote_type and bill x vote_type in a single pass;
+    # the bill matrix, per party and state, only when the bills report needs it
+    if 'bills' in reports:
+        # parse party and state once
+        legislator_groups = LegislatorGroups.from_legislators(dataset.legislators)
+        histograms = VoteTypeHistograms.from_vote_results(
+            dataset.vote_results, dataset.votes, dataset.bills, legislator_groups
+        )
+    else:
+        histograms = VoteTypeHistograms.from_vote_results(dataset.vote_results)
+
+    # validation reads the same histograms, so it adds little to the run
+    if validate:
+        print_validation(dataset, histograms)
+
+    if 'legislators' in reports:
+        run_legislators_report(repository, dataset, histograms, args)
 
-    
+    if 'bills' in reports:
+        run_bills_report(repository, dataset, histograms, args)
 
 
 if __name__ == "__main__":
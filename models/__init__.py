@@ -1,17 +1,43 @@
 from .models import (
+    SUPPORT,
+    OPPOSE,
+    ABSTAIN,
+    PRESENT,
+    NOT_VOTING,
+    VOTE_TYPE_LABELS,
+    VALID_VOTE_TYPES,
+    Record,
     Bill,
     Legislator,
     VoteResult,
     Vote,
     LegislatorVoteCount,
-    BillVoteCount
+    BillVoteCount,
+    VoteTypeCount,
+    DatasetSummary,
+    LegislatorAttributes,
+    BillGroupVoteCount,
+    ValidationReport
 )
 
 __all__ = [
+    'SUPPORT',
+    'OPPOSE',
+    'ABSTAIN',
+    'PRESENT',
+    'NOT_VOTING',
+    'VOTE_TYPE_LABELS',
+    'VALID_VOTE_TYPES',
+    'Record',
     'Bill',
     'Legislator',
     'VoteResult',
     'Vote',
     'LegislatorVoteCount',
-    'BillVoteCount'
+    'BillVoteCount',
+    'VoteTypeCount',
+    'DatasetSummary',
+    'LegislatorAttributes',
+    'BillGroupVoteCount',
+    'ValidationReport'
 ]
@@ -1,24 +1,65 @@
 from dataclasses import dataclass
+from itertools import starmap
+from typing import Iterable, List, Sequence, Type, TypeVar
+
+
+R = TypeVar('R', bound='Record')
+
+# vote_type codes of VoteResult
+SUPPORT = 1
+OPPOSE = 2
+ABSTAIN = 3
+PRESENT = 4
+NOT_VOTING = 5
+VOTE_TYPE_LABELS = {
+    SUPPORT: 'support',
+    OPPOSE: 'oppose',
+    ABSTAIN: 'abstain',
+    PRESENT: 'present',
+    NOT_VOTING: 'not_voting'
+}
+VALID_VOTE_TYPES = frozenset(VOTE_TYPE_LABELS)
+
+
+class Record:
+    """Base class for compact records stored without a per-instance __dict__"""
+    __slots__ = ()
+
+    @classmethod
+    def from_rows(cls: Type[R], rows: Iterable[Sequence]) -> List[R]:
+        """
+        Build records in bulk from tuples ordered like the dataclass fields
+
+        Args:
+            rows: Iterable of tuples holding already converted field values
+
+        Returns:
+            List of record instances
+        """
+        return list(starmap(cls, rows))
 
 
 @dataclass
-class Bill:
+class Bill(Record):
     """Represents a bill"""
+    __slots__ = ('id', 'title', 'sponsor_id')
     id: int
     title: str
     sponsor_id: int
 
 
 @dataclass
-class Legislator:
+class Legislator(Record):
     """Represents a legislator"""
+    __slots__ = ('id', 'name')
     id: int
     name: str
 
 
 @dataclass
-class VoteResult:
+class VoteResult(Record):
     """Represents a vote result"""
+    __slots__ = ('id', 'legislator_id', 'vote_id', 'vote_type')
     id: int
     legislator_id: int
     vote_id: int
@@ -26,15 +67,17 @@ class VoteResult:
 
 
 @dataclass
-class Vote:
+class Vote(Record):
     """Represents a vote"""
+    __slots__ = ('id', 'bill_id')
     id: int
     bill_id: int
 
 
 @dataclass
-class LegislatorVoteCount:
+class LegislatorVoteCount(Record):
     """Represents vote counts for a legislator"""
+    __slots__ = ('id', 'name', 'num_supported_bills', 'num_opposed_bills')
     id: int
     name: str
     num_supported_bills: int
@@ -42,10 +85,77 @@ class LegislatorVoteCount:
 
 
 @dataclass
-class BillVoteCount:
+class BillVoteCount(Record):
     """Represents vote counts for a bill"""
+    __slots__ = ('id', 'title', 'supporter_count', 'opposer_count', 'primary_sponsor')
     id: int
     title: str
     supporter_count: int
     opposer_count: int
     primary_sponsor: str
+
+
+@dataclass
+class VoteTypeCount(Record):
+    """Represents vote counts per vote type for a legislator or a bill"""
+    __slots__ = ('id', 'name', 'counts')
+    id: int
+    name: str
+    counts: List[int]
+
+
+@dataclass
+class DatasetSummary(Record):
+    """Represents the processing summary of a single dataset"""
+    __slots__ = (
+        'name', 'total_bills', 'total_legislators', 'total_votes',
+        'total_vote_results', 'total_supported', 'total_opposed'
+    )
+    name: str
+    total_bills: int
+    total_legislators: int
+    total_votes: int
+    total_vote_results: int
+    total_supported: int
+    total_opposed: int
+
+
+@dataclass
+class LegislatorAttributes(Record):
+    """Represents the party and district parsed from a legislator name"""
+    __slots__ = ('id', 'party', 'state', 'district')
+    id: int
+    party: str
+    state: str
+    district: str
+
+
+@dataclass
+class BillGroupVoteCount(Record):
+    """Represents vote counts for a bill within a group of legislators"""
+    __slots__ = ('id', 'title', 'group', 'supporter_count', 'opposer_count')
+    id: int
+    title: str
+    group: str
+    supporter_count: int
+    opposer_count: int
+
+
+@dataclass
+class ValidationReport(Record):
+    """Represents referential-integrity issues found in the loaded tables"""
+    __slots__ = (
+        'orphan_votes', 'orphan_vote_results', 'unknown_legislators',
+        'unknown_sponsors', 'duplicate_vote_result_ids', 'invalid_vote_types'
+    )
+    orphan_votes: List[int]
+    orphan_vote_results: List[int]
+    unknown_legislators: List[int]
+    unknown_sponsors: List[int]
+    duplicate_vote_result_ids: List[int]
+    invalid_vote_types: List[int]
+
+    @property
+    def is_valid(self) -> bool:
+        """True when no issue was found"""
+        return not any(getattr(self, name) for name in self.__slots__)
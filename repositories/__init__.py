@@ -1,3 +1,31 @@
+from importlib import import_module
+
 from .legislators_orm import LegislatorsRepository
+from .lazy_dataset import LazyDataset
+
+# Imported on first access so that main.py does not pay for asyncio and
+# multiprocessing at startup
+_LAZY_EXPORTS = {
+    'AsyncLegislatorsRepository': '.async_legislators_orm',
+    'SharedReferenceTables': '.shared_memory',
+    'SharedReferenceTablesDescriptor': '.shared_memory',
+    'SharedDataset': '.shared_memory',
+    'SharedDatasetDescriptor': '.shared_memory',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        return getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-__all__ = ['LegislatorsRepository']
+__all__ = [
+    'LegislatorsRepository',
+    'LazyDataset',
+    'AsyncLegislatorsRepository',
+    'SharedReferenceTables',
+    'SharedReferenceTablesDescriptor',
+    'SharedDataset',
+    'SharedDatasetDescriptor'
+]
@@ -0,0 +1,142 @@
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import AsyncIterator, Iterator, List, Optional
+
+from models import Record, Bill, Legislator, VoteResult, Vote
+from .legislators_orm import LegislatorsRepository
+
+
+class AsyncLegislatorsRepository:
+    """
+    Asyncio facade over LegislatorsRepository
+
+    CSV parsing and writing run in an executor so the event loop stays
+    responsive. Tables are parsed in chunks, and at most one chunk is parsed
+    ahead of the consumer, which bounds memory when the consumer is slower
+    than the parser.
+    """
+
+    def __init__(
+        self,
+        repository: Optional[LegislatorsRepository] = None,
+        chunk_size: int = 10000,
+        executor: Optional[Executor] = None
+    ):
+        """
+        Initialize the facade
+
+        Args:
+            repository: Synchronous repository to wrap (default: LegislatorsRepository())
+            chunk_size: Number of records parsed per executor call
+            executor: Executor running the blocking calls (default: the loop's executor)
+        """
+        self.repository = repository if repository is not None else LegislatorsRepository()
+        self.chunk_size = chunk_size
+        self.executor = executor
+
+    async def _run(self, function, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(function, *args, **kwargs))
+
+    async def iter_chunks(self, table: str) -> AsyncIterator[List[Record]]:
+        """
+        Stream an input table chunk by chunk
+
+        Args:
+            table: One of 'bills', 'legislators', 'votes' or 'vote_results'
+        """
+        chunks: Iterator[List[Record]] = self.repository.iter_chunks(table, self.chunk_size)
+        pending = asyncio.ensure_future(self._run(next, chunks, None))
+        try:
+            while True:
+                # Shielded so that cancelling the consumer does not mark the call
+                # done while the executor thread is still inside next(chunks)
+                chunk = await asyncio.shield(pending)
+                if chunk is None:
+                    break
+                # Parse the next chunk while the consumer handles this one
+                pending = asyncio.ensure_future(self._run(next, chunks, None))
+                yield chunk
+        finally:
+            # The generator may only be closed once no executor call is using it
+            cancelled = False
+            while not pending.done():
+                try:
+                    await asyncio.wait([pending])
+                except asyncio.CancelledError:
+                    cancelled = True
+            if not pending.cancelled():
+                # Retrieve a parse error so it is not reported as never retrieved
+                pending.exception()
+            await self._run(chunks.close)
+            if cancelled:
+                raise asyncio.CancelledError()
+
+    async def _iter_records(self, table: str) -> AsyncIterator[Record]:
+        chunks = self.iter_chunks(table)
+        try:
+            async for chunk in chunks:
+                for record in chunk:
+                    yield record
+        finally:
+            # Close the chunk stream now rather than whenever it is garbage collected
+            await chunks.aclose()
+
+    async def _load(self, table: str) -> List[Record]:
+        records: List[Record] = []
+        async for chunk in self.iter_chunks(table):
+            records.extend(chunk)
+        return records
+
+    def iter_bills(self) -> AsyncIterator[Bill]:
+        """Stream bills.csv as Bill instances"""
+        return self._iter_records('bills')
+
+    def iter_legislators(self) -> AsyncIterator[Legislator]:
+        """Stream legislators.csv as Legislator instances"""
+        return self._iter_records('legislators')
+
+    def iter_vote_results(self) -> AsyncIterator[VoteResult]:
+        """Stream vote_results.csv as VoteResult instances"""
+        return self._iter_records('vote_results')
+
+    def iter_votes(self) -> AsyncIterator[Vote]:
+        """Stream votes.csv as Vote instances"""
+        return self._iter_records('votes')
+
+    async def load_bills(self) -> List[Bill]:
+        """Read bills.csv and return a list of Bill instances"""
+        return await self._load('bills')
+
+    async def load_legislators(self) -> List[Legislator]:
+        """Read legislators.csv and return a list of Legislator instances"""
+        return await self._load('legislators')
+
+    async def load_vote_results(self) -> List[VoteResult]:
+        """Read vote_results.csv and return a list of VoteResult instances"""
+        return await self._load('vote_results')
+
+    async def load_votes(self) -> List[Vote]:
+        """Read votes.csv and return a list of Vote instances"""
+        return await self._load('votes')
+
+    async def save_legislator_vote_counts(self, *args, **kwargs) -> None:
+        """Awaitable LegislatorsRepository.save_legislator_vote_counts"""
+        await self._run(self.repository.save_legislator_vote_counts, *args, **kwargs)
+
+    async def save_bill_vote_counts(self, *args, **kwargs) -> None:
+        """Awaitable LegislatorsRepository.save_bill_vote_counts"""
+        await self._run(self.repository.save_bill_vote_counts, *args, **kwargs)
+
+    async def save_bill_group_vote_counts(self, *args, **kwargs) -> None:
+        """Awaitable LegislatorsRepository.save_bill_group_vote_counts"""
+        await self._run(self.repository.save_bill_group_vote_counts, *args, **kwargs)
+
+    async def save_vote_type_counts(self, *args, **kwargs) -> None:
+        """Awaitable LegislatorsRepository.save_vote_type_counts"""
+        await self._run(self.repository.save_vote_type_counts, *args, **kwargs)
+
+    async def save_dataset_summaries(self, *args, **kwargs) -> None:
+        """Awaitable LegislatorsRepository.save_dataset_summaries"""
+        await self._run(self.repository.save_dataset_summaries, *args, **kwargs)
@@ -0,0 +1,74 @@
+from typing import Dict, Iterable, List
+
+from models import Bill, Legislator, VoteResult, Vote
+from .legislators_orm import LegislatorsRepository
+
+
+class LazyDataset:
+    """
+    Input tables loaded on first access
+
+    Row counts of loaded tables are their parsed lengths. Only tables that
+    are never loaded are counted with fast line counting, so summaries and
+    single reports never parse tables they do not need.
+    """
+
+    def __init__(self, repository: LegislatorsRepository):
+        """
+        Initialize the dataset without reading any table
+        
+        Args:
+            repository: Repository the tables are loaded from
+        """
+        self.repository = repository
+        self._tables: Dict[str, list] = {}
+
+    def _load(self, table: str, loader) -> list:
+        if table not in self._tables:
+            self._tables[table] = loader()
+        return self._tables[table]
+
+    @property
+    def bills(self) -> List[Bill]:
+        """Bills, loaded on first access"""
+        return self._load('bills', self.repository.get_all_bills)
+
+    @property
+    def legislators(self) -> List[Legislator]:
+        """Legislators, loaded on first access"""
+        return self._load('legislators', self.repository.get_all_legislators)
+
+    @property
+    def votes(self) -> List[Vote]:
+        """Votes, loaded on first access"""
+        return self._load('votes', self.repository.get_all_votes)
+
+    @property
+    def vote_results(self) -> List[VoteResult]:
+        """Vote results, loaded on first access"""
+        return self._load('vote_results', self.repository.get_all_vote_results)
+
+    def load(self, tables: Iterable[str]) -> None:
+        """
+        Load the given tables now, so their row counts are the parsed lengths
+        
+        Args:
+            tables: Names among 'bills', 'legislators', 'votes' and 'vote_results'
+        """
+        for table in tables:
+            getattr(self, table)
+
+    def is_loaded(self, table: str) -> bool:
+        """True when the table has already been loaded"""
+        return table in self._tables
+
+    def row_count(self, table: str) -> int:
+        """
+        Number of rows of a table, without loading it
+        
+        Args:
+            table: One of 'bills', 'legislators', 'votes' or 'vote_results'
+        """
+        if table in self._tables:
+            return len(self._tables[table])
+        return self.repository.count_rows(table)
@@ -1,13 +1,25 @@
 import csv
+import glob
+import json
+from functools import partial
+from itertools import islice
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import List
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-from models import Bill, Legislator, VoteResult, Vote, LegislatorVoteCount, BillVoteCount
+from models import Record, Bill, Legislator, VoteResult, Vote, LegislatorVoteCount, BillVoteCount, DatasetSummary, BillGroupVoteCount, VoteTypeCount
 
 
 class LegislatorsRepository:
     """Repository class to read CSV data and return dataclass instances"""
     
+    TABLE_FILES = {
+        'bills': "bills.csv",
+        'legislators': "legislators.csv",
+        'votes': "votes.csv",
+        'vote_results': "vote_results.csv",
+    }
+    
     def __init__(self, datasets_path: str = "datasets", datasets_input_path: str = "datasets/input", datasets_output_path = "datasets/output"):
         """
         Initialize the repository with the path to the datasets folder
@@ -19,72 +31,148 @@ class LegislatorsRepository:
         self.datasets_input_path = Path(datasets_input_path)
         self.datasets_output_path = Path(datasets_output_path)
 
-    def get_all_bills(self) -> List[Bill]:
-        """Read bills.csv and return a list of Bill instances"""
-        bills = []
-        bills_file = self.datasets_input_path / "bills.csv"
+    def _read_columns(self, file_name: str, columns: Sequence[str]) -> Iterator[Sequence[str]]:
+        """
+        Yield the requested columns of every non-empty row of an input CSV file
         
-        with open(bills_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+        Args:
+            file_name: Name of the CSV file in the datasets_input_path directory
+            columns: Header names to extract, in the order they are yielded
+        """
+        with open(self.datasets_input_path / file_name, 'r', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return
+            # Map header names to positions once instead of building a dict per row
+            positions = [header.index(column) for column in columns]
+            if len(positions) == 1:
+                # itemgetter with a single index returns a bare value, not a 1-tuple
+                position = positions[0]
+                getter = lambda row: (row[position],)
+            else:
+                getter = itemgetter(*positions)
             for row in reader:
-                bill = Bill(
-                    id=int(row['id']),
-                    title=row['title'],
-                    sponsor_id=int(row['sponsor_id'])
-                )
-                bills.append(bill)
-        
-        return bills
+                if row:
+                    yield getter(row)
+
+    def _bill_rows(self) -> Iterator[Tuple[int, str, int]]:
+        rows = self._read_columns("bills.csv", ('id', 'title', 'sponsor_id'))
+        return (
+            (int(bill_id), title, int(sponsor_id))
+            for bill_id, title, sponsor_id in rows
+        )
+
+    def _legislator_rows(self) -> Iterator[Tuple[int, str]]:
+        rows = self._read_columns("legislators.csv", ('id', 'name'))
+        return (
+            (int(legislator_id), name)
+            for legislator_id, name in rows
+        )
+
+    def _vote_result_rows(self) -> Iterator[Tuple[int, int, int, int]]:
+        rows = self._read_columns(
+            "vote_results.csv", ('id', 'legislator_id', 'vote_id', 'vote_type')
+        )
+        return (
+            (int(vote_result_id), int(legislator_id), int(vote_id), int(vote_type))
+            for vote_result_id, legislator_id, vote_id, vote_type in rows
+        )
+
+    def _vote_rows(self) -> Iterator[Tuple[int, int]]:
+        rows = self._read_columns("votes.csv", ('id', 'bill_id'))
+        return (
+            (int(vote_id), int(bill_id))
+            for vote_id, bill_id in rows
+        )
+
+    def get_all_bills(self) -> List[Bill]:
+        """Read bills.csv and return a list of Bill instances"""
+        return Bill.from_rows(self._bill_rows())
     
     def get_all_legislators(self) -> List[Legislator]:
         """Read legislators.csv and return a list of Legislator instances"""
-        legislators = []
-        legislators_file = self.datasets_input_path / "legislators.csv"
-        
-        with open(legislators_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                legislator = Legislator(
-                    id=int(row['id']),
-                    name=row['name']
-                )
-                legislators.append(legislator)
-        
-        return legislators
+        return Legislator.from_rows(self._legislator_rows())
     
     def get_all_vote_results(self) -> List[VoteResult]:
         """Read vote_results.csv and return a list of VoteResult instances"""
-        vote_results = []
-        vote_results_file = self.datasets_input_path / "vote_results.csv"
-        
-        with open(vote_results_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                vote_result = VoteResult(
-                    id=int(row['id']),
-                    legislator_id=int(row['legislator_id']),
-                    vote_id=int(row['vote_id']),
-                    vote_type=int(row['vote_type'])
-                )
-                vote_results.append(vote_result)
-        
-        return vote_results
+        return VoteResult.from_rows(self._vote_result_rows())
     
     def get_all_votes(self) -> List[Vote]:
         """Read votes.csv and return a list of Vote instances"""
-        votes = []
-        votes_file = self.datasets_input_path / "votes.csv"
+        return Vote.from_rows(self._vote_rows())
+    
+    def iter_chunks(self, table: str, chunk_size: int = 10000) -> Iterator[List[Record]]:
+        """
+        Read an input table in chunks instead of all at once
         
-        with open(votes_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                vote = Vote(
-                    id=int(row['id']),
-                    bill_id=int(row['bill_id'])
-                )
-                votes.append(vote)
+        Args:
+            table: One of 'bills', 'legislators', 'votes' or 'vote_results'
+            chunk_size: Maximum number of records per chunk
+            
+        Returns:
+            Iterator of lists of record instances; the file stays open until
+            the iterator is exhausted or closed
+        """
+        tables = {
+            'bills': (Bill, self._bill_rows),
+            'legislators': (Legislator, self._legislator_rows),
+            'votes': (Vote, self._vote_rows),
+            'vote_results': (VoteResult, self._vote_result_rows),
+        }
+        if table not in tables:
+            raise ValueError(f"Unknown table: {table}")
         
-        return votes
+        record_class, table_rows = tables[table]
+        return self._chunks(record_class, table_rows(), chunk_size)
+
+    def count_rows(self, table: str) -> int:
+        """
+        Count the data rows of an input table without parsing it
+        
+        Counts newlines in binary blocks, which is much faster than parsing
+        the CSV. Blank lines are skipped anywhere in the file, like the
+        parser does. Quoted fields spanning several lines are counted once
+        per physical line, so such tables should be counted after loading.
+        
+        Args:
+            table: One of 'bills', 'legislators', 'votes' or 'vote_results'
+            
+        Returns:
+            Number of non-blank lines after the header
+        """
+        if table not in self.TABLE_FILES:
+            raise ValueError(f"Unknown table: {table}")
+        
+        lines = 0
+        # Treat the start of the file as following a newline so leading blank lines are skipped
+        last = b'\n'
+        with open(self.datasets_input_path / self.TABLE_FILES[table], 'rb') as f:
+            for block in iter(partial(f.read, 1 << 20), b''):
+                data = block.replace(b'\r', b'')
+                if not data:
+                    continue
+                # Collapse runs of newlines, including one spanning the previous
+                # block, so every remaining newline ends a non-blank line
+                joined = last + data
+                while b'\n\n' in joined:
+                    joined = joined.replace(b'\n\n', b'\n')
+                lines += joined.count(b'\n') - (1 if last == b'\n' else 0)
+                last = data[-1:]
+        
+        if last != b'\n':
+            # Last line has no terminating newline
+            lines += 1
+        
+        # Exclude the header
+        return max(lines - 1, 0)
+
+    @staticmethod
+    def _chunks(record_class, rows: Iterator[tuple], chunk_size: int) -> Iterator[List[Record]]:
+        chunk = record_class.from_rows(islice(rows, chunk_size))
+        while chunk:
+            yield chunk
+            chunk = record_class.from_rows(islice(rows, chunk_size))
     
     def save_legislator_vote_counts(
         self, 
@@ -152,3 +240,174 @@ class LegislatorsRepository:
                     'opposer_count': bill_vote_count.opposer_count,
                     'primary_sponsor': bill_vote_count.primary_sponsor
                 })
+
+    def save_bill_group_vote_counts(
+        self,
+        bill_group_vote_counts: List[BillGroupVoteCount],
+        dimension: str = "party",
+        output_file: str = "bills-by-party.csv"
+    ) -> None:
+        """
+        Save a list of BillGroupVoteCount instances to a CSV file
+        
+        Args:
+            bill_group_vote_counts: List of BillGroupVoteCount instances to save
+            dimension: Group dimension, used as the header of the group column
+            output_file: Name of the output CSV file (default: bills-by-party.csv)
+                        The file will be saved in the datasets_output_path directory
+        """
+        output_path = self.datasets_output_path / output_file
+        
+        # Ensure the directory exists
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        with open(output_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(
+                f,
+                fieldnames=['id', 'title', dimension, 'supporter_count', 'opposer_count']
+            )
+            writer.writeheader()
+            
+            for bill_group_vote_count in bill_group_vote_counts:
+                writer.writerow({
+                    'id': bill_group_vote_count.id,
+                    'title': bill_group_vote_count.title,
+                    dimension: bill_group_vote_count.group,
+                    'supporter_count': bill_group_vote_count.supporter_count,
+                    'opposer_count': bill_group_vote_count.opposer_count
+                })
+    
+    def save_vote_type_counts(
+        self,
+        vote_type_counts: List[VoteTypeCount],
+        labels: List[str],
+        output_file: str = "legislators-vote-types.csv",
+        name_field: str = "name"
+    ) -> None:
+        """
+        Save a list of VoteTypeCount instances to a CSV file
+        
+        Args:
+            vote_type_counts: List of VoteTypeCount instances to save
+            labels: Vote type labels, one header per entry of VoteTypeCount.counts
+            output_file: Name of the output CSV file (default: legislators-vote-types.csv)
+                        The file will be saved in the datasets_output_path directory
+            name_field: Header of the name column, e.g. "title" for bills
+        """
+        output_path = self.datasets_output_path / output_file
+        
+        # Ensure the directory exists
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        with open(output_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['id', name_field, *labels])
+            
+            for vote_type_count in vote_type_counts:
+                writer.writerow([vote_type_count.id, vote_type_count.name, *vote_type_count.counts])
+    
+    def save_dataset_summaries(
+        self,
+        summaries: List[DatasetSummary],
+        output_file: str = "summary.csv"
+    ) -> None:
+        """
+        Save a list of DatasetSummary instances to a CSV file
+        
+        Args:
+            summaries: List of DatasetSummary instances to save
+            output_file: Name of the output CSV file (default: summary.csv)
+                        The file will be saved in the datasets_output_path directory
+        """
+        output_path = self.datasets_output_path / output_file
+        
+        # Ensure the directory exists
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        with open(output_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(
+                f,
+                fieldnames=[
+                    'name', 'total_bills', 'total_legislators', 'total_votes',
+                    'total_vote_results', 'total_supported', 'total_opposed'
+                ]
+            )
+            writer.writeheader()
+            
+            for summary in summaries:
+                writer.writerow({
+                    'name': summary.name,
+                    'total_bills': summary.total_bills,
+                    'total_legislators': summary.total_legislators,
+                    'total_votes': summary.total_votes,
+                    'total_vote_results': summary.total_vote_results,
+                    'total_supported': summary.total_supported,
+                    'total_opposed': summary.total_opposed
+                })
+
+    def save_partitioned(
+        self,
+        save: Callable[..., None],
+        records: Iterable[Record],
+        output_file: str,
+        max_rows: int,
+        sort_key: Optional[str] = None
+    ) -> List[str]:
+        """
+        Save records as size-bounded partition files plus a JSON manifest
+        
+        Args:
+            save: One of the save_* methods of this repository, e.g.
+                  repository.save_legislator_vote_counts, or a functools.partial
+                  of it binding its extra arguments
+            records: Records to save, consumed lazily
+            output_file: Name of the unpartitioned CSV file; partitions are named
+                        <stem>-part-00000<suffix> and the manifest <stem>.manifest.json
+            max_rows: Maximum number of records per partition file
+            sort_key: Attribute the records are sorted by; when given, the first
+                      and last value of each partition are recorded in the manifest
+            
+        Returns:
+            Names of the partition files, in order
+            
+        Note:
+            Partition files of the same name left by an earlier, larger run
+            are removed first, so the directory matches the manifest
+        """
+        if max_rows < 1:
+            raise ValueError("max_rows must be at least 1")
+        
+        output_path = Path(output_file)
+        stale_pattern = f"{glob.escape(output_path.stem)}-part-{'[0-9]' * 5}{glob.escape(output_path.suffix)}"
+        for stale_partition in (self.datasets_output_path / output_path.parent).glob(stale_pattern):
+            stale_partition.unlink()
+        get_key = attrgetter(sort_key) if sort_key else None
+        iterator = iter(records)
+        partitions = []
+        
+        chunk = list(islice(iterator, max_rows))
+        while chunk:
+            partition_file = f"{output_path.stem}-part-{len(partitions):05d}{output_path.suffix}"
+            save(chunk, output_file=partition_file)
+            
+            partition = {'file': partition_file, 'rows': len(chunk)}
+            if get_key is not None:
+                partition['first'] = get_key(chunk[0])
+                partition['last'] = get_key(chunk[-1])
+            partitions.append(partition)
+            
+            chunk = list(islice(iterator, max_rows))
+        
+        manifest = {
+            'source': output_file,
+            'sort_key': sort_key,
+            'max_rows': max_rows,
+            'total_rows': sum(partition['rows'] for partition in partitions),
+            'partitions': partitions
+        }
+        manifest_path = self.datasets_output_path / f"{output_path.stem}.manifest.json"
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        
+        return [partition['file'] for partition in partitions]
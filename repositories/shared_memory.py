@@ -0,0 +1,293 @@
+from array import array
+from itertools import accumulate, chain
+from multiprocessing import shared_memory
+from operator import attrgetter
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, TypeVar
+
+from models import Bill, Legislator, VoteResult
+
+
+T = TypeVar('T')
+
+
+class SharedReferenceTablesDescriptor(NamedTuple):
+    """Small picklable handle used by worker processes to attach to the tables"""
+    name: str
+    num_legislators: int
+    num_bills: int
+    names_size: int
+    titles_size: int
+
+
+def _text_offsets(strings: List[str]) -> Iterable[int]:
+    # Character offsets of each string inside their concatenation, plus the end
+    return chain((0,), accumulate(map(len, strings)))
+
+
+class SharedReferenceTables:
+    """
+    Legislator and bill reference tables stored in a single shared memory block
+
+    Ids are stored as int64 columns and the names and titles as UTF-8 text
+    with int64 character offsets, so workers rebuild the records without any
+    CSV parsing or int() conversion. The block holds, in order: legislator
+    ids, name offsets, bill ids, sponsor ids, title offsets, names, titles.
+    """
+
+    ITEM_SIZE = 8
+
+    def __init__(
+        self,
+        shm: shared_memory.SharedMemory,
+        descriptor: SharedReferenceTablesDescriptor,
+        owner: bool
+    ):
+        self._shm = shm
+        self.descriptor = descriptor
+        self._owner = owner
+
+    @classmethod
+    def create(cls, legislators: List[Legislator], bills: List[Bill]) -> "SharedReferenceTables":
+        """
+        Copy the reference tables into a new shared memory block
+
+        Args:
+            legislators: List of Legislator instances
+            bills: List of Bill instances
+
+        Returns:
+            SharedReferenceTables owning the shared memory block
+        """
+        names = [legislator.name for legislator in legislators]
+        titles = [bill.title for bill in bills]
+        integers = array('q', map(attrgetter('id'), legislators))
+        integers.extend(_text_offsets(names))
+        integers.extend(map(attrgetter('id'), bills))
+        integers.extend(map(attrgetter('sponsor_id'), bills))
+        integers.extend(_text_offsets(titles))
+        names_data = ''.join(names).encode('utf-8')
+        titles_data = ''.join(titles).encode('utf-8')
+
+        integers_size = len(integers) * cls.ITEM_SIZE
+        names_end = integers_size + len(names_data)
+        total_size = names_end + len(titles_data)
+
+        # SharedMemory does not accept a zero sized block
+        shm = shared_memory.SharedMemory(create=True, size=max(total_size, 1))
+        shm.buf[:integers_size] = integers.tobytes()
+        shm.buf[integers_size:names_end] = names_data
+        shm.buf[names_end:total_size] = titles_data
+
+        descriptor = SharedReferenceTablesDescriptor(
+            name=shm.name,
+            num_legislators=len(legislators),
+            num_bills=len(bills),
+            names_size=len(names_data),
+            titles_size=len(titles_data)
+        )
+        return cls(shm, descriptor, owner=True)
+
+    @classmethod
+    def attach(cls, descriptor: SharedReferenceTablesDescriptor) -> "SharedReferenceTables":
+        """Attach to a block previously created with create()"""
+        shm = shared_memory.SharedMemory(name=descriptor.name)
+        return cls(shm, descriptor, owner=False)
+
+    def _integers(self, start: int, count: int) -> List[int]:
+        # start and count are in int64 items
+        begin = start * self.ITEM_SIZE
+        with self._shm.buf[begin:begin + count * self.ITEM_SIZE] as raw, raw.cast('q') as view:
+            return view.tolist()
+
+    def _strings(self, start: int, size: int, offsets: List[int]) -> List[str]:
+        # start and size are in bytes; offsets are character offsets into the decoded text
+        text = bytes(self._shm.buf[start:start + size]).decode('utf-8')
+        return [text[begin:end] for begin, end in zip(offsets, offsets[1:])]
+
+    def _integers_size(self) -> int:
+        num_legislators, num_bills = self.descriptor.num_legislators, self.descriptor.num_bills
+        return (2 * num_legislators + 3 * num_bills + 2) * self.ITEM_SIZE
+
+    def get_all_legislators(self) -> List[Legislator]:
+        """Rebuild the shared legislators table"""
+        num_legislators = self.descriptor.num_legislators
+        ids = self._integers(0, num_legislators)
+        offsets = self._integers(num_legislators, num_legislators + 1)
+        names = self._strings(self._integers_size(), self.descriptor.names_size, offsets)
+        return Legislator.from_rows(zip(ids, names))
+
+    def get_all_bills(self) -> List[Bill]:
+        """Rebuild the shared bills table"""
+        num_bills = self.descriptor.num_bills
+        start = 2 * self.descriptor.num_legislators + 1
+        ids = self._integers(start, num_bills)
+        sponsor_ids = self._integers(start + num_bills, num_bills)
+        offsets = self._integers(start + 2 * num_bills, num_bills + 1)
+        titles = self._strings(
+            self._integers_size() + self.descriptor.names_size,
+            self.descriptor.titles_size,
+            offsets
+        )
+        return Bill.from_rows(zip(ids, titles, sponsor_ids))
+
+    def close(self) -> None:
+        """Detach from the block, removing it when called by the owner"""
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+    def __enter__(self) -> "SharedReferenceTables":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> Optional[bool]:
+        self.close()
+        return None
+
+
+class SharedColumn(NamedTuple):
+    """Position of one int64 column inside a SharedDataset block"""
+    name: str
+    offset: int
+    length: int
+
+
+class SharedDatasetDescriptor(NamedTuple):
+    """Small picklable handle used by worker processes to attach to a dataset"""
+    name: str
+    columns: Tuple[SharedColumn, ...]
+
+    @property
+    def num_rows(self) -> int:
+        """Length of the first column, i.e. the row count of a single table dataset"""
+        return self.columns[0].length if self.columns else 0
+
+    def read_columns(
+        self,
+        names: Sequence[str],
+        function: Callable[..., T],
+        start: int = 0,
+        stop: Optional[int] = None
+    ) -> T:
+        """
+        Attach to the dataset and call function with views of the rows start:stop of the named columns
+        
+        The views are released once function returns, so it must not keep
+        references to them. Bound to a descriptor, this method is picklable
+        and can be sent to worker processes.
+        
+        Args:
+            names: Column names given to SharedDataset.create(), in argument order
+            function: Callable receiving one int64 memoryview per column
+            start: First row to read
+            stop: Row after the last row to read (default: end of the columns)
+            
+        Returns:
+            Whatever function returns
+        """
+        with SharedDataset.attach(self) as dataset:
+            return function(*[dataset.column(name, start, stop) for name in names])
+
+
+class SharedDataset:
+    """
+    Parsed integer columns stored in a single shared memory block
+
+    Workers attach through the descriptor and read the columns as int64
+    memoryviews, so a table is never pickled or copied per worker. Views
+    returned by column() are released by close(); slices taken from them
+    must be released by the caller first.
+    """
+
+    ITEM_SIZE = 8
+
+    def __init__(
+        self,
+        shm: shared_memory.SharedMemory,
+        descriptor: SharedDatasetDescriptor,
+        owner: bool
+    ):
+        self._shm = shm
+        self.descriptor = descriptor
+        self._owner = owner
+        self._columns = {column.name: column for column in descriptor.columns}
+        self._views: List[memoryview] = []
+
+    @classmethod
+    def create(cls, columns: Dict[str, Iterable[int]]) -> "SharedDataset":
+        """
+        Copy integer columns into a new shared memory block
+
+        Args:
+            columns: Map of column name to integer values; columns may have
+                different lengths
+
+        Returns:
+            SharedDataset owning the shared memory block
+        """
+        arrays = {name: array('q', values) for name, values in columns.items()}
+        total_size = sum(len(values) for values in arrays.values()) * cls.ITEM_SIZE
+
+        # SharedMemory does not accept a zero sized block
+        shm = shared_memory.SharedMemory(create=True, size=max(total_size, 1))
+        layout = []
+        offset = 0
+        for name, values in arrays.items():
+            size = len(values) * cls.ITEM_SIZE
+            shm.buf[offset:offset + size] = values.tobytes()
+            layout.append(SharedColumn(name=name, offset=offset, length=len(values)))
+            offset += size
+
+        descriptor = SharedDatasetDescriptor(name=shm.name, columns=tuple(layout))
+        return cls(shm, descriptor, owner=True)
+
+    @classmethod
+    def from_vote_results(cls, vote_results: List[VoteResult]) -> "SharedDataset":
+        """Share the id, legislator_id, vote_id and vote_type columns of the vote results"""
+        return cls.create({
+            field: map(attrgetter(field), vote_results)
+            for field in VoteResult.__slots__
+        })
+
+    @classmethod
+    def attach(cls, descriptor: SharedDatasetDescriptor) -> "SharedDataset":
+        """Attach to a block previously created with create()"""
+        shm = shared_memory.SharedMemory(name=descriptor.name)
+        return cls(shm, descriptor, owner=False)
+
+    def __len__(self) -> int:
+        """Length of the first column, i.e. the row count of a single table dataset"""
+        return self.descriptor.num_rows
+
+    def column(self, name: str, start: int = 0, stop: Optional[int] = None) -> memoryview:
+        """
+        Zero-copy int64 view of a column, or of the rows start:stop of it
+
+        Args:
+            name: Column name given to create()
+            start: First row of the view
+            stop: Row after the last row of the view (default: end of column)
+        """
+        column = self._columns[name]
+        start, stop, _ = slice(start, stop).indices(column.length)
+        stop = max(start, stop)
+        begin = column.offset + start * self.ITEM_SIZE
+        end = column.offset + stop * self.ITEM_SIZE
+        view = self._shm.buf[begin:end].cast('q')
+        self._views.append(view)
+        return view
+
+    def close(self) -> None:
+        """Release the column views and detach, removing the block when called by the owner"""
+        for view in self._views:
+            view.release()
+        self._views.clear()
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+    def __enter__(self) -> "SharedDataset":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> Optional[bool]:
+        self.close()
+        return None
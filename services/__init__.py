@@ -1,10 +1,36 @@
+from importlib import import_module
+
 from .legislators_support_oppose_count import legislators_support_oppose_count
-from .bills_support_oppose_count import bills_support_oppose_count
+from .bills_support_oppose_count import bills_support_oppose_count, bills_support_oppose_count_by_group
+from .legislator_groups import LegislatorGroups, parse_legislator_attributes
+from .validation import validate_dataset
+from .report_sorting import sort_report
+from .vote_type_histogram import VoteTypeHistograms
 from models import LegislatorVoteCount, BillVoteCount
 
+# Imported on first access so that main.py does not pay for multiprocessing at startup
+_LAZY_EXPORTS = {
+    'count_shared_vote_types': '.shared_aggregation',
+    'parallel_vote_type_histograms': '.shared_aggregation',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        return getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     'legislators_support_oppose_count',
     'bills_support_oppose_count',
+    'bills_support_oppose_count_by_group',
+    'LegislatorGroups',
+    'parse_legislator_attributes',
+    'validate_dataset',
+    'sort_report',
+    'VoteTypeHistograms',
+    'count_shared_vote_types',
+    'parallel_vote_type_histograms',
     'LegislatorVoteCount',
     'BillVoteCount'
 ]
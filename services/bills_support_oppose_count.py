@@ -1,13 +1,16 @@
-from typing import List, Dict
+from typing import List, Optional
 
-from models import Bill, Vote, VoteResult, Legislator, BillVoteCount
+from models import Bill, Vote, VoteResult, Legislator, BillVoteCount, BillGroupVoteCount
+from .legislator_groups import LegislatorGroups
+from .vote_type_histogram import VoteTypeHistograms
 
 
 def bills_support_oppose_count(
     bills: List[Bill],
     votes: List[Vote],
     vote_results: List[VoteResult],
-    legislators: List[Legislator]
+    legislators: List[Legislator],
+    histograms: Optional[VoteTypeHistograms] = None
 ) -> List[BillVoteCount]:
     """
     Count support and oppose votes for each bill and identify primary sponsor
@@ -17,6 +20,8 @@ def bills_support_oppose_count(
         votes: List of Vote instances
         vote_results: List of VoteResult instances
         legislators: List of Legislator instances
+        histograms: VoteTypeHistograms already counted from vote_results,
+            votes and bills, to share a single counting pass between reports
         
     Returns:
         List of BillVoteCount instances with support/oppose counts
@@ -25,56 +30,44 @@ def bills_support_oppose_count(
     Note:
         vote_type 1 = Support
         vote_type 2 = Oppose
+        Counts are a view of the bill x vote_type matrix of VoteTypeHistograms
     """
-    # Create maps for efficient lookups
-    legislator_map = {legislator.id: legislator.name for legislator in legislators}
-    vote_map: Dict[int, List[int]] = {}  # bill_id -> list of vote_ids
-    
-    # Build map of bill_id to vote_ids
-    for vote in votes:
-        if vote.bill_id not in vote_map:
-            vote_map[vote.bill_id] = []
-        vote_map[vote.bill_id].append(vote.id)
-    
-    # Create map of vote_id to vote results for efficient lookup
-    vote_results_map: Dict[int, List[VoteResult]] = {}
-    for vote_result in vote_results:
-        if vote_result.vote_id not in vote_results_map:
-            vote_results_map[vote_result.vote_id] = []
-        vote_results_map[vote_result.vote_id].append(vote_result)
+    if histograms is None:
+        histograms = VoteTypeHistograms.from_vote_results(vote_results, votes, bills)
+    return histograms.bill_vote_counts(bills, legislators)
+
+
+def bills_support_oppose_count_by_group(
+    bills: List[Bill],
+    votes: List[Vote],
+    vote_results: List[VoteResult],
+    legislator_groups: LegislatorGroups,
+    dimension: str = 'party',
+    histograms: Optional[VoteTypeHistograms] = None
+) -> List[BillGroupVoteCount]:
+    """
+    Count support and oppose votes for each bill, broken down by legislator group
     
-    # Process each bill
-    result = []
-    for bill in bills:
-        supporter_count = 0
-        opposer_count = 0
-        
-        # Get all votes for this bill
-        bill_vote_ids = vote_map.get(bill.id, [])
-        
-        # Count support and oppose votes across all votes for this bill
-        for vote_id in bill_vote_ids:
-            vote_result_list = vote_results_map.get(vote_id, [])
-            for vote_result in vote_result_list:
-                if vote_result.vote_type == 1:
-                    supporter_count += 1
-                elif vote_result.vote_type == 2:
-                    opposer_count += 1
+    Args:
+        bills: List of Bill instances
+        votes: List of Vote instances
+        vote_results: List of VoteResult instances
+        legislator_groups: LegislatorGroups built once from the legislators
+        dimension: Group dimension, 'party' or 'state'
+        histograms: VoteTypeHistograms already counted from vote_results,
+            votes, bills and legislator_groups, so every dimension and the
+            bill report share a single counting pass
         
-        # Get primary sponsor name
-        primary_sponsor = legislator_map.get(
-            bill.sponsor_id, 
-            f"Unknown"
-        )
+    Returns:
+        List of BillGroupVoteCount instances, ordered by bill and then by
+        group label; groups without support or oppose votes are omitted
         
-        result.append(
-            BillVoteCount(
-                id=bill.id,
-                title=bill.title,
-                supporter_count=supporter_count,
-                opposer_count=opposer_count,
-                primary_sponsor=primary_sponsor
-            )
+    Note:
+        Counts are a view of the bill x group x vote_type matrix of
+        VoteTypeHistograms, which keeps every vote type
+    """
+    if histograms is None or histograms.groups is not legislator_groups:
+        histograms = VoteTypeHistograms.from_vote_results(
+            vote_results, votes, bills, legislator_groups
         )
-    
-    return result
+    return histograms.bill_group_vote_counts(bills, dimension)
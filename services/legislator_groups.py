@@ -0,0 +1,95 @@
+import re
+from typing import Dict, List, Tuple
+
+from models import Legislator, LegislatorAttributes
+
+
+UNKNOWN_GROUP = "Unknown"
+
+# Attributes a legislator can be grouped by
+GROUP_DIMENSIONS = ('party', 'state')
+
+# Matches the trailing "(R-NE-2)" or "(D-CA)" suffix of a legislator name; the
+# district accepts anything, e.g. "At Large", so it never discards party and state
+_ATTRIBUTES_PATTERN = re.compile(r'\(([A-Za-z]+)-([A-Z]{2})(?:-([^)]+))?\)\s*$')
+
+
+def parse_legislator_attributes(legislator: Legislator) -> LegislatorAttributes:
+    """
+    Parse party, state and district from a legislator name
+
+    Args:
+        legislator: Legislator instance, e.g. named "Rep. Don Bacon (R-NE-2)"
+
+    Returns:
+        LegislatorAttributes instance; party and state are "Unknown" and
+        district is empty when the name has no recognizable suffix
+    """
+    match = _ATTRIBUTES_PATTERN.search(legislator.name)
+    if match is None:
+        return LegislatorAttributes(legislator.id, UNKNOWN_GROUP, UNKNOWN_GROUP, "")
+
+    party, state, district = match.groups()
+    return LegislatorAttributes(legislator.id, party, state, district or "")
+
+
+class LegislatorGroups:
+    """
+    Dense group codes for the party and state of each legislator
+
+    Names are parsed once when the groups are built. Codes are assigned in
+    sorted label order, so code i of a dimension is labels(dimension)[i].
+    Legislators missing from the table share the "Unknown" code.
+    """
+
+    def __init__(self, attributes: List[LegislatorAttributes]):
+        self._labels: Dict[str, List[str]] = {}
+        self._codes: Dict[str, Dict[int, int]] = {}
+
+        for dimension in GROUP_DIMENSIONS:
+            values = {attribute.id: getattr(attribute, dimension) for attribute in attributes}
+            labels = sorted(set(values.values()) | {UNKNOWN_GROUP})
+            label_codes = {label: code for code, label in enumerate(labels)}
+
+            self._labels[dimension] = labels
+            self._codes[dimension] = {
+                legislator_id: label_codes[value]
+                for legislator_id, value in values.items()
+            }
+
+    @classmethod
+    def from_legislators(cls, legislators: List[Legislator]) -> "LegislatorGroups":
+        """Parse the attributes of every legislator and encode them"""
+        return cls([parse_legislator_attributes(legislator) for legislator in legislators])
+
+    def labels(self, dimension: str) -> List[str]:
+        """Group labels of a dimension, indexed by group code"""
+        return self._labels[dimension]
+
+    def codes(self, dimension: str) -> Dict[int, int]:
+        """Map of legislator_id to group code for a dimension"""
+        return self._codes[dimension]
+
+    def cells(self) -> Tuple[Dict[int, int], List[Tuple[int, ...]]]:
+        """
+        Encode each distinct combination of group codes as one cell
+        
+        Counting per cell lets every dimension be aggregated in a single
+        increment per vote; cell 0 is the all-"Unknown" combination, which
+        also holds legislators missing from the table.
+        
+        Returns:
+            Map of legislator_id to cell, and the group codes of each cell
+            in GROUP_DIMENSIONS order
+        """
+        unknown = tuple(self.unknown_code(dimension) for dimension in GROUP_DIMENSIONS)
+        cell_codes = {unknown: 0}
+        legislator_cells = {}
+        for legislator_id in self._codes[GROUP_DIMENSIONS[0]]:
+            codes = tuple(self._codes[dimension][legislator_id] for dimension in GROUP_DIMENSIONS)
+            legislator_cells[legislator_id] = cell_codes.setdefault(codes, len(cell_codes))
+        return legislator_cells, list(cell_codes)
+    
+    def unknown_code(self, dimension: str) -> int:
+        """Group code used for legislators without a known group"""
+        return self._labels[dimension].index(UNKNOWN_GROUP)
@@ -0,0 +1,34 @@
+from operator import attrgetter
+from typing import Iterable, List, TypeVar
+
+from models import Record
+
+
+R = TypeVar('R', bound=Record)
+
+
+def _sort_key(key: str):
+    # Ties on a count column are broken by id so the order never depends on input order
+    return attrgetter(key) if key == 'id' else attrgetter(key, 'id')
+
+
+def sort_report(
+    records: Iterable[R],
+    key: str = 'id',
+    reverse: bool = False
+) -> List[R]:
+    """
+    Sort report records deterministically by id or by a count column
+
+    The records of a report are already in memory, so a single sorted()
+    call is faster than sorting runs and merging them.
+
+    Args:
+        records: Report records, e.g. LegislatorVoteCount instances
+        key: Record attribute to sort by; ties are broken by id
+        reverse: Sort in descending order
+
+    Returns:
+        List of the records in sorted order
+    """
+    return sorted(records, key=_sort_key(key), reverse=reverse)
@@ -0,0 +1,99 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterable, List, Optional
+
+from models import Bill, Vote
+from .vote_type_histogram import VoteTypeHistograms
+
+
+# Shared vote result columns read by count_shared_vote_types, in argument order
+VOTE_RESULT_COLUMNS = ('legislator_id', 'vote_id', 'vote_type')
+
+
+# Small reference tables sent once per worker by _init_worker
+_votes: List[Vote] = []
+_bills: List[Bill] = []
+
+
+def _init_worker(votes: List[Vote], bills: List[Bill]) -> None:
+    global _votes, _bills
+    _votes = votes
+    _bills = bills
+
+
+def count_shared_vote_types(
+    legislator_ids: Iterable[int],
+    vote_ids: Iterable[int],
+    vote_types: Iterable[int],
+    votes: Optional[List[Vote]] = None,
+    bills: Optional[List[Bill]] = None
+) -> VoteTypeHistograms:
+    """
+    Count vote type histograms inside a worker, with its votes and bills
+    
+    Meant to receive zero-copy views of shared vote result columns, e.g.
+    through SharedDatasetDescriptor.read_columns(VOTE_RESULT_COLUMNS, ...).
+    
+    Args:
+        legislator_ids: legislator_id column of the vote results
+        vote_ids: vote_id column of the vote results
+        vote_types: vote_type column of the vote results
+        votes: List of Vote instances (default: the worker's votes)
+        bills: List of Bill instances (default: the worker's bills)
+        
+    Returns:
+        VoteTypeHistograms of the given rows
+    """
+    return VoteTypeHistograms.from_columns(
+        legislator_ids,
+        vote_ids,
+        vote_types,
+        _votes if votes is None else votes,
+        _bills if bills is None else bills
+    )
+
+
+def parallel_vote_type_histograms(
+    descriptor,
+    votes: List[Vote],
+    bills: List[Bill],
+    workers: Optional[int] = None
+) -> VoteTypeHistograms:
+    """
+    Count vote type histograms of a shared vote results dataset in a process pool
+    
+    Each worker receives only the descriptor and a row range; the partial
+    histograms are merged in shard order, so the result matches a single
+    pass over all rows.
+    
+    Args:
+        descriptor: SharedDatasetDescriptor of a dataset built with
+            SharedDataset.from_vote_results(); only its num_rows and
+            read_columns() are used
+        votes: List of Vote instances
+        bills: List of Bill instances
+        workers: Number of worker processes (default: os.cpu_count())
+        
+    Returns:
+        VoteTypeHistograms of all vote results
+    """
+    num_rows = descriptor.num_rows
+    num_shards = workers or os.cpu_count() or 1
+    shard_size = max(-(-num_rows // num_shards), 1)
+    bounds = [(start, min(start + shard_size, num_rows)) for start in range(0, num_rows, shard_size)]
+    
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(votes, bills)
+    ) as executor:
+        parts = list(executor.map(
+            partial(descriptor.read_columns, VOTE_RESULT_COLUMNS, count_shared_vote_types),
+            [start for start, _ in bounds],
+            [stop for _, stop in bounds]
+        ))
+    
+    if not parts:
+        return VoteTypeHistograms.from_columns([], [], [], votes, bills)
+    return VoteTypeHistograms.merge(parts)
@@ -0,0 +1,80 @@
+from collections import Counter
+from operator import attrgetter
+from typing import List, Optional
+
+from models import Bill, Legislator, Vote, VoteResult, ValidationReport, VALID_VOTE_TYPES
+from .vote_type_histogram import VoteTypeHistograms, OTHER_LABEL
+
+
+def validate_dataset(
+    bills: List[Bill],
+    legislators: List[Legislator],
+    votes: List[Vote],
+    vote_results: List[VoteResult],
+    histograms: Optional[VoteTypeHistograms] = None
+) -> ValidationReport:
+    """
+    Check referential integrity of the loaded tables
+
+    The legislator, vote_id and vote_type checks read the histograms the
+    reports are built from, so only the duplicate id check scans the vote
+    results. Row-level scans run only when an issue is found.
+
+    Args:
+        bills: List of Bill instances
+        legislators: List of Legislator instances
+        votes: List of Vote instances
+        vote_results: List of VoteResult instances
+        histograms: VoteTypeHistograms counted from vote_results (default:
+            counted here, which costs as much as the aggregation itself)
+
+    Returns:
+        ValidationReport with:
+        - orphan_votes: ids of votes whose bill_id is not a known bill
+        - orphan_vote_results: ids of vote results whose vote_id is not a known vote
+        - unknown_legislators: legislator ids referenced by vote results but not in legislators
+        - unknown_sponsors: sponsor ids of bills that are not in legislators
+        - duplicate_vote_result_ids: vote result ids appearing more than once
+        - invalid_vote_types: ids of vote results with a vote_type outside VALID_VOTE_TYPES
+    """
+    if histograms is None:
+        histograms = VoteTypeHistograms.from_vote_results(vote_results)
+
+    bill_ids = set(map(attrgetter('id'), bills))
+    legislator_ids = set(map(attrgetter('id'), legislators))
+    vote_ids = set(map(attrgetter('id'), votes))
+
+    # The only scan of its own: fewer distinct ids than rows means duplicates,
+    # and only then are they counted
+    duplicate_vote_result_ids: List[int] = []
+    if len(set(map(attrgetter('id'), vote_results))) != len(vote_results):
+        duplicate_vote_result_ids = sorted(
+            vote_result_id
+            for vote_result_id, count in Counter(map(attrgetter('id'), vote_results)).items()
+            if count > 1
+        )
+
+    # Every vote_id missing from votes matched no bill while counting
+    unknown_vote_ids = histograms.unmatched_vote_ids - vote_ids
+    orphan_vote_results = [
+        vote_result.id
+        for vote_result in vote_results
+        if vote_result.vote_id in unknown_vote_ids
+    ] if unknown_vote_ids else []
+
+    # Codes outside VALID_VOTE_TYPES are counted in the "other" column
+    other_column = VoteTypeHistograms.labels.index(OTHER_LABEL)
+    invalid_vote_types = [
+        vote_result.id
+        for vote_result in vote_results
+        if vote_result.vote_type not in VALID_VOTE_TYPES
+    ] if histograms.legislator_column_total(other_column) else []
+
+    return ValidationReport(
+        orphan_votes=[vote.id for vote in votes if vote.bill_id not in bill_ids],
+        orphan_vote_results=orphan_vote_results,
+        unknown_legislators=sorted(set(histograms.legislator_ids) - legislator_ids),
+        unknown_sponsors=sorted(set(map(attrgetter('sponsor_id'), bills)) - legislator_ids),
+        duplicate_vote_result_ids=duplicate_vote_result_ids,
+        invalid_vote_types=invalid_vote_types
+    )
@@ -0,0 +1,407 @@
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from models import (
+    Bill,
+    Vote,
+    VoteResult,
+    Legislator,
+    LegislatorVoteCount,
+    BillVoteCount,
+    BillGroupVoteCount,
+    VoteTypeCount,
+    SUPPORT,
+    OPPOSE,
+    VOTE_TYPE_LABELS,
+)
+from .legislator_groups import LegislatorGroups, GROUP_DIMENSIONS
+
+
+# Column collecting every vote_type code missing from VOTE_TYPE_LABELS
+OTHER_LABEL = 'other'
+
+_vote_result_columns = attrgetter('legislator_id', 'vote_id', 'vote_type')
+
+
+def _add_rows(
+    keys: List[int],
+    offsets: Dict[int, int],
+    counts: List[int],
+    part_keys: List[int],
+    part_counts: List[int],
+    width: int
+) -> None:
+    """Add the keyed count rows of one histogram to another, appending unseen keys"""
+    for position, key in enumerate(part_keys):
+        offset = offsets.get(key)
+        if offset is None:
+            offset = offsets[key] = len(counts)
+            keys.append(key)
+            counts.extend([0] * width)
+        start = position * width
+        for column in range(width):
+            counts[offset + column] += part_counts[start + column]
+
+
+class VoteTypeHistograms:
+    """
+    Dense legislator x vote_type and bill x vote_type count matrices
+
+    Both matrices are flat integer lists in row-major order with one column
+    per code of VOTE_TYPE_LABELS plus a trailing "other" column, so no vote
+    is dropped. Legislator rows follow the order in which legislators first
+    appear in the vote results; bill rows follow the order of the bills.
+
+    When counted with LegislatorGroups, the bill votes are also counted per
+    group cell, i.e. per combination of party and state codes, in the same
+    pass; the per-party and per-state bill matrices are views of these cells.
+    Only (bill, cell) pairs that received votes get a row.
+    """
+
+    vote_types = sorted(VOTE_TYPE_LABELS)
+    labels = [VOTE_TYPE_LABELS[vote_type] for vote_type in vote_types] + [OTHER_LABEL]
+    width = len(labels)
+
+    def __init__(
+        self,
+        legislator_ids: List[int],
+        legislator_counts: List[int],
+        bill_ids: List[int],
+        bill_cell_keys: List[int],
+        bill_cell_counts: List[int],
+        groups: Optional[LegislatorGroups] = None,
+        cells: Optional[List[Tuple[int, ...]]] = None,
+        unmatched_vote_ids: Optional[Set[int]] = None
+    ):
+        """
+        Args:
+            legislator_ids: Legislator id of each legislator row
+            legislator_counts: Flat legislator x vote_type matrix
+            bill_ids: Bill id of each bill position
+            bill_cell_keys: bill position * len(cells) + cell of each bill cell row
+            bill_cell_counts: Flat bill cell x vote_type matrix
+            groups: LegislatorGroups the cells were built from, if any
+            cells: Group codes of each cell in GROUP_DIMENSIONS order
+                (default: a single cell holding every legislator)
+            unmatched_vote_ids: vote_ids of vote results that matched no bill
+        """
+        self.legislator_ids = legislator_ids
+        self.legislator_counts = legislator_counts
+        self.bill_ids = bill_ids
+        self.bill_cell_keys = bill_cell_keys
+        self.bill_cell_counts = bill_cell_counts
+        self.groups = groups
+        self.cells = cells if cells is not None else [()]
+        self.unmatched_vote_ids = unmatched_vote_ids if unmatched_vote_ids is not None else set()
+        # Every cell of a bill summed into its single bill row
+        self.bill_counts = self._sum_cells(lambda cell: 0, 1)
+
+    @classmethod
+    def _encode_bills(cls, votes: Optional[List[Vote]], bills: Optional[List[Bill]], num_cells: int):
+        """Encode bill ids, and vote ids straight to the first bill cell key of their bill"""
+        bill_ids: List[int] = []
+        bill_keys: Dict[int, int] = {}
+        for bill in bills or ():
+            if bill.id not in bill_keys:
+                bill_keys[bill.id] = len(bill_ids) * num_cells
+                bill_ids.append(bill.id)
+        vote_keys = {
+            vote.id: bill_keys[vote.bill_id]
+            for vote in votes or ()
+            if vote.bill_id in bill_keys
+        }
+        return bill_ids, vote_keys
+
+    @classmethod
+    def _count(
+        cls,
+        rows: Iterable[Tuple[int, int, int]],
+        votes: Optional[List[Vote]],
+        bills: Optional[List[Bill]],
+        groups: Optional[LegislatorGroups]
+    ) -> "VoteTypeHistograms":
+        """Count both matrices in a single pass over (legislator_id, vote_id, vote_type) rows"""
+        width = cls.width
+        other_column = width - 1
+        get_column = {vote_type: column for column, vote_type in enumerate(cls.vote_types)}.get
+        if groups is None:
+            legislator_cells: Dict[int, int] = {}
+            cells: List[Tuple[int, ...]] = [()]
+        else:
+            legislator_cells, cells = groups.cells()
+        # Cell 0 holds legislators without a known group
+        get_cell = legislator_cells.get
+        bill_ids, vote_keys = cls._encode_bills(votes, bills, len(cells))
+        get_bill_key = vote_keys.get
+
+        encoded_legislator_ids: List[int] = []
+        legislator_offsets: Dict[int, int] = {}
+        get_legislator_offset = legislator_offsets.get
+        legislator_counts: List[int] = []
+        bill_cell_keys: List[int] = []
+        bill_cell_offsets: Dict[int, int] = {}
+        get_bill_cell_offset = bill_cell_offsets.get
+        bill_cell_counts: List[int] = []
+        # Collected for validation: orphan vote results are among these
+        unmatched_vote_ids: Set[int] = set()
+        add_unmatched_vote_id = unmatched_vote_ids.add
+        empty_row = [0] * width
+
+        for legislator_id, vote_id, vote_type in rows:
+            column = get_column(vote_type, other_column)
+
+            offset = get_legislator_offset(legislator_id)
+            if offset is None:
+                offset = legislator_offsets[legislator_id] = len(legislator_counts)
+                encoded_legislator_ids.append(legislator_id)
+                legislator_counts.extend(empty_row)
+            legislator_counts[offset + column] += 1
+
+            key = get_bill_key(vote_id)
+            if key is not None:
+                key += get_cell(legislator_id, 0)
+                offset = get_bill_cell_offset(key)
+                if offset is None:
+                    offset = bill_cell_offsets[key] = len(bill_cell_counts)
+                    bill_cell_keys.append(key)
+                    bill_cell_counts.extend(empty_row)
+                bill_cell_counts[offset + column] += 1
+            else:
+                add_unmatched_vote_id(vote_id)
+
+        return cls(
+            encoded_legislator_ids, legislator_counts,
+            bill_ids, bill_cell_keys, bill_cell_counts,
+            groups, cells, unmatched_vote_ids
+        )
+
+    @classmethod
+    def from_columns(
+        cls,
+        legislator_ids: Iterable[int],
+        vote_ids: Iterable[int],
+        vote_types: Iterable[int],
+        votes: Optional[List[Vote]] = None,
+        bills: Optional[List[Bill]] = None,
+        groups: Optional[LegislatorGroups] = None
+    ) -> "VoteTypeHistograms":
+        """
+        Count both matrices in a single pass over the vote result columns
+
+        Args:
+            legislator_ids: legislator_id column of the vote results
+            vote_ids: vote_id column of the vote results
+            vote_types: vote_type column of the vote results
+            votes: List of Vote instances, needed for the bill matrix
+            bills: List of Bill instances, needed for the bill matrix
+            groups: LegislatorGroups, needed for the per-group bill matrices
+
+        Returns:
+            VoteTypeHistograms instance; the bill matrix is empty when
+            votes or bills are not given
+        """
+        return cls._count(zip(legislator_ids, vote_ids, vote_types), votes, bills, groups)
+
+    @classmethod
+    def from_vote_results(
+        cls,
+        vote_results: List[VoteResult],
+        votes: Optional[List[Vote]] = None,
+        bills: Optional[List[Bill]] = None,
+        groups: Optional[LegislatorGroups] = None
+    ) -> "VoteTypeHistograms":
+        """Count both matrices in a single pass over a list of VoteResult instances"""
+        return cls._count(map(_vote_result_columns, vote_results), votes, bills, groups)
+
+    @classmethod
+    def merge(cls, parts: List["VoteTypeHistograms"]) -> "VoteTypeHistograms":
+        """
+        Sum histograms counted over consecutive shards of the same vote results
+
+        Args:
+            parts: Histograms in shard order, all counted with the same votes,
+                bills and groups
+
+        Returns:
+            VoteTypeHistograms equal to counting all shards in a single pass
+        """
+        width = cls.width
+        legislator_ids: List[int] = []
+        legislator_offsets: Dict[int, int] = {}
+        legislator_counts: List[int] = []
+        bill_cell_keys: List[int] = []
+        bill_cell_offsets: Dict[int, int] = {}
+        bill_cell_counts: List[int] = []
+        unmatched_vote_ids: Set[int] = set()
+
+        for part in parts:
+            _add_rows(
+                legislator_ids, legislator_offsets, legislator_counts,
+                part.legislator_ids, part.legislator_counts, width
+            )
+            _add_rows(
+                bill_cell_keys, bill_cell_offsets, bill_cell_counts,
+                part.bill_cell_keys, part.bill_cell_counts, width
+            )
+            unmatched_vote_ids |= part.unmatched_vote_ids
+
+        if not parts:
+            return cls([], [], [], [], [])
+        return cls(
+            legislator_ids, legislator_counts,
+            parts[0].bill_ids, bill_cell_keys, bill_cell_counts,
+            parts[0].groups, parts[0].cells, unmatched_vote_ids
+        )
+
+    def _sum_cells(self, cell_group, num_groups: int) -> List[int]:
+        """Flat bill x group x vote_type matrix summing the cells of each group"""
+        width = self.width
+        num_cells = len(self.cells)
+        counts = self.bill_cell_counts
+        result = [0] * (len(self.bill_ids) * num_groups * width)
+        for position, key in enumerate(self.bill_cell_keys):
+            bill_position, cell = divmod(key, num_cells)
+            offset = (bill_position * num_groups + cell_group(cell)) * width
+            start = position * width
+            for column in range(width):
+                result[offset + column] += counts[start + column]
+        return result
+
+    def _bill_positions(self, bills: List[Bill]) -> List[int]:
+        positions = {bill_id: position for position, bill_id in enumerate(self.bill_ids)}
+        result = []
+        for bill in bills:
+            position = positions.get(bill.id)
+            if position is None:
+                raise ValueError(
+                    f"Bill {bill.id} is not in the bill matrix; build the histograms "
+                    "with the same votes and bills"
+                )
+            result.append(position)
+        return result
+
+    def _column(self, vote_type: int) -> int:
+        return self.vote_types.index(vote_type)
+
+    def legislator_column_total(self, column: int) -> int:
+        """Number of votes counted in a column, over all legislators"""
+        return sum(self.legislator_counts[column::self.width])
+
+    def legislator_row(self, position: int) -> List[int]:
+        """Counts per vote type of the legislator at a row position"""
+        start = position * self.width
+        return self.legislator_counts[start:start + self.width]
+
+    def bill_row(self, position: int) -> List[int]:
+        """Counts per vote type of the bill at a row position"""
+        start = position * self.width
+        return self.bill_counts[start:start + self.width]
+
+    def bill_group_counts(self, dimension: str) -> List[int]:
+        """
+        Bill x group x vote_type matrix of a group dimension
+
+        Args:
+            dimension: Group dimension, 'party' or 'state'
+
+        Returns:
+            Flat integer list in row-major order; group codes index the
+            labels of the dimension in the LegislatorGroups
+        """
+        if self.groups is None:
+            raise ValueError("Histograms were counted without legislator groups")
+        index = GROUP_DIMENSIONS.index(dimension)
+        cells = self.cells
+        return self._sum_cells(lambda cell: cells[cell][index], len(self.groups.labels(dimension)))
+
+    def legislator_vote_counts(self, legislators: List[Legislator]) -> List[LegislatorVoteCount]:
+        """Support/oppose view of the legislator matrix"""
+        legislator_map = {legislator.id: legislator.name for legislator in legislators}
+        support = self._column(SUPPORT)
+        oppose = self._column(OPPOSE)
+        counts = self.legislator_counts
+        width = self.width
+
+        return [
+            LegislatorVoteCount(
+                id=legislator_id,
+                name=legislator_map.get(legislator_id, f"Unknown (ID: {legislator_id})"),
+                num_supported_bills=counts[position * width + support],
+                num_opposed_bills=counts[position * width + oppose]
+            )
+            for position, legislator_id in enumerate(self.legislator_ids)
+        ]
+
+    def bill_vote_counts(self, bills: List[Bill], legislators: List[Legislator]) -> List[BillVoteCount]:
+        """Support/oppose view of the bill matrix, with the primary sponsor name"""
+        legislator_map = {legislator.id: legislator.name for legislator in legislators}
+        support = self._column(SUPPORT)
+        oppose = self._column(OPPOSE)
+        counts = self.bill_counts
+        width = self.width
+
+        return [
+            BillVoteCount(
+                id=bill.id,
+                title=bill.title,
+                supporter_count=counts[position * width + support],
+                opposer_count=counts[position * width + oppose],
+                primary_sponsor=legislator_map.get(bill.sponsor_id, "Unknown")
+            )
+            for bill, position in zip(bills, self._bill_positions(bills))
+        ]
+
+    def bill_group_vote_counts(self, bills: List[Bill], dimension: str) -> List[BillGroupVoteCount]:
+        """
+        Support/oppose view of the bill x group matrix of a dimension
+
+        Records are ordered by bill and then by group label; groups without
+        support or oppose votes on a bill are omitted.
+        """
+        counts = self.bill_group_counts(dimension)
+        labels = self.groups.labels(dimension)
+        support = self._column(SUPPORT)
+        oppose = self._column(OPPOSE)
+        width = self.width
+
+        result = []
+        for bill, position in zip(bills, self._bill_positions(bills)):
+            for group_code, label in enumerate(labels):
+                offset = (position * len(labels) + group_code) * width
+                supporter_count = counts[offset + support]
+                opposer_count = counts[offset + oppose]
+                if supporter_count or opposer_count:
+                    result.append(
+                        BillGroupVoteCount(
+                            id=bill.id,
+                            title=bill.title,
+                            group=label,
+                            supporter_count=supporter_count,
+                            opposer_count=opposer_count
+                        )
+                    )
+        return result
+
+    def legislator_vote_type_counts(self, legislators: List[Legislator]) -> List[VoteTypeCount]:
+        """Full vote type view of the legislator matrix"""
+        legislator_map = {legislator.id: legislator.name for legislator in legislators}
+        return [
+            VoteTypeCount(
+                id=legislator_id,
+                name=legislator_map.get(legislator_id, f"Unknown (ID: {legislator_id})"),
+                counts=self.legislator_row(position)
+            )
+            for position, legislator_id in enumerate(self.legislator_ids)
+        ]
+
+    def bill_vote_type_counts(self, bills: List[Bill]) -> List[VoteTypeCount]:
+        """Full vote type view of the bill matrix"""
+        titles = {bill.id: bill.title for bill in bills}
+        return [
+            VoteTypeCount(
+                id=bill_id,
+                name=titles[bill_id],
+                counts=self.bill_row(position)
+            )
+            for position, bill_id in enumerate(self.bill_ids)
+        ]
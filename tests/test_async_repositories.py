@@ -0,0 +1,147 @@
+import asyncio
+import csv
+import tempfile
+import threading
+import pytest
+from pathlib import Path
+from repositories import LegislatorsRepository, AsyncLegislatorsRepository
+from models import VoteResult, LegislatorVoteCount
+
+
+def _write_vote_results(input_dir, count):
+    with open(input_dir / "vote_results.csv", 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=['id', 'legislator_id', 'vote_id', 'vote_type'])
+        writer.writeheader()
+        for i in range(count):
+            writer.writerow({'id': i, 'legislator_id': i % 3, 'vote_id': 100, 'vote_type': 1 + i % 2})
+
+
+class TestAsyncLegislatorsRepository:
+    """Tests for AsyncLegislatorsRepository"""
+    
+    def setup_method(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.input_dir = Path(self.tmpdir.name) / "input"
+        self.input_dir.mkdir()
+        self.output_dir = Path(self.tmpdir.name) / "output"
+        self.repo = AsyncLegislatorsRepository(
+            LegislatorsRepository(
+                datasets_input_path=str(self.input_dir),
+                datasets_output_path=str(self.output_dir)
+            ),
+            chunk_size=4
+        )
+    
+    def teardown_method(self):
+        self.tmpdir.cleanup()
+    
+    def test_load_vote_results_matches_sync_api(self):
+        """Test that chunked async loading returns the same records as the sync API"""
+        _write_vote_results(self.input_dir, 10)
+        
+        vote_results = asyncio.run(self.repo.load_vote_results())
+        
+        assert vote_results == self.repo.repository.get_all_vote_results()
+        assert len(vote_results) == 10
+    
+    def test_iter_chunks_sizes(self):
+        """Test that tables are streamed in chunks of at most chunk_size"""
+        _write_vote_results(self.input_dir, 10)
+        
+        async def collect():
+            return [len(chunk) async for chunk in self.repo.iter_chunks('vote_results')]
+        
+        assert asyncio.run(collect()) == [4, 4, 2]
+    
+    def test_async_for_streaming_with_early_exit(self):
+        """Test row streaming and closing the stream before it is exhausted"""
+        _write_vote_results(self.input_dir, 10)
+        
+        # Record the chunk streams opened by the record stream
+        chunk_streams = []
+        iter_chunks = self.repo.iter_chunks
+        
+        def spy_iter_chunks(table):
+            chunk_streams.append(iter_chunks(table))
+            return chunk_streams[-1]
+        
+        self.repo.iter_chunks = spy_iter_chunks
+        
+        async def first_three():
+            records = []
+            stream = self.repo.iter_vote_results()
+            async for vote_result in stream:
+                records.append(vote_result)
+                if len(records) == 3:
+                    break
+            await stream.aclose()
+            # Checked before asyncio.run() finalizes leftover async generators;
+            # a closed async generator has no frame left
+            assert chunk_streams[0].ag_frame is None
+            return records
+        
+        records = asyncio.run(first_three())
+        
+        assert records[0] == VoteResult(id=0, legislator_id=0, vote_id=100, vote_type=1)
+        assert len(records) == 3
+        assert len(chunk_streams) == 1
+    
+    def test_cancel_while_parsing(self):
+        """Test that cancelling the consumer mid-parse waits for the parse before closing"""
+        started = threading.Event()
+        release = threading.Event()
+        closed = []
+        
+        def slow_chunks(table, chunk_size):
+            try:
+                started.set()
+                release.wait(5)
+                yield [VoteResult(id=0, legislator_id=0, vote_id=100, vote_type=1)]
+            finally:
+                closed.append(table)
+        
+        self.repo.repository.iter_chunks = slow_chunks
+        
+        async def consume():
+            async for _ in self.repo.iter_chunks('vote_results'):
+                pass
+        
+        async def cancel_mid_parse():
+            task = asyncio.ensure_future(consume())
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            task.cancel()
+            # Let the cancellation reach the stream while next() is still running
+            await asyncio.sleep(0.05)
+            assert not task.done()
+            release.set()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        
+        asyncio.run(cancel_mid_parse())
+        
+        assert closed == ['vote_results']
+    
+    def test_empty_table(self):
+        """Test loading a table with only a header"""
+        with open(self.input_dir / "votes.csv", 'w', encoding='utf-8') as f:
+            f.write("id,bill_id\n")
+        
+        assert asyncio.run(self.repo.load_votes()) == []
+    
+    def test_unknown_table(self):
+        """Test that an unknown table name is rejected"""
+        async def collect():
+            return [chunk async for chunk in self.repo.iter_chunks('sponsors')]
+        
+        with pytest.raises(ValueError):
+            asyncio.run(collect())
+    
+    def test_save_legislator_vote_counts(self):
+        """Test awaitable saving through the wrapped repository"""
+        vote_counts = [LegislatorVoteCount(id=1, name="John Doe", num_supported_bills=5, num_opposed_bills=3)]
+        
+        asyncio.run(self.repo.save_legislator_vote_counts(vote_counts, output_file="legislators.csv"))
+        
+        with open(self.output_dir / "legislators.csv", 'r', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+            assert rows[0]['num_supported_bills'] == '5'
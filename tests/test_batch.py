@@ -0,0 +1,96 @@
+import csv
+import tempfile
+import pytest
+from pathlib import Path
+from batch import run_batch
+from models import Bill, Legislator
+from repositories import SharedReferenceTables
+
+
+def _write_csv(path, fieldnames, rows):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+class TestSharedReferenceTables:
+    """Tests for SharedReferenceTables"""
+    
+    def test_attach_reads_tables(self):
+        """Test that an attached handle decodes the tables written by the owner"""
+        legislators = [
+            Legislator(id=1, name="Rep. John Doe (D-NY-1)"),
+            Legislator(id=2, name="Jane, Smith"),
+            Legislator(id=3, name="Rep. Nydia Velázquez (D-NY-7)"),
+            Legislator(id=4, name="")
+        ]
+        bills = [
+            Bill(id=10, title="H.R. 1: \"Quoted\"\nAct", sponsor_id=1),
+            Bill(id=11, title="S. 2: Año fiscal", sponsor_id=-1)
+        ]
+        
+        with SharedReferenceTables.create(legislators, bills) as tables:
+            attached = SharedReferenceTables.attach(tables.descriptor)
+            try:
+                assert attached.get_all_legislators() == legislators
+                assert attached.get_all_bills() == bills
+            finally:
+                attached.close()
+    
+    def test_empty_tables(self):
+        """Test sharing empty reference tables"""
+        with SharedReferenceTables.create([], []) as tables:
+            assert tables.get_all_legislators() == []
+            assert tables.get_all_bills() == []
+
+
+class TestRunBatch:
+    """Tests for run_batch"""
+    
+    def test_processes_each_dataset(self):
+        """Test per-dataset reports and the combined summary"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reference_dir = Path(tmpdir) / "reference"
+            reference_dir.mkdir()
+            _write_csv(reference_dir / "legislators.csv", ['id', 'name'],
+                       [{'id': 1, 'name': 'John Doe'}, {'id': 2, 'name': 'Jane Smith'}])
+            _write_csv(reference_dir / "bills.csv", ['id', 'title', 'sponsor_id'],
+                       [{'id': 10, 'title': 'Bill 10', 'sponsor_id': 1}])
+            
+            input_dirs = []
+            for name, vote_type in (("session-a", 1), ("session-b", 2)):
+                input_dir = Path(tmpdir) / name
+                input_dir.mkdir()
+                _write_csv(input_dir / "votes.csv", ['id', 'bill_id'], [{'id': 100, 'bill_id': 10}])
+                _write_csv(input_dir / "vote_results.csv", ['id', 'legislator_id', 'vote_id', 'vote_type'],
+                           [{'id': 1, 'legislator_id': 1, 'vote_id': 100, 'vote_type': vote_type},
+                            {'id': 2, 'legislator_id': 2, 'vote_id': 100, 'vote_type': 1}])
+                input_dirs.append(str(input_dir))
+            
+            output_dir = Path(tmpdir) / "output"
+            summaries = run_batch(input_dirs, str(reference_dir), str(output_dir), workers=2)
+            
+            assert [summary.name for summary in summaries] == ["session-a", "session-b"]
+            assert summaries[0].total_supported == 2
+            assert summaries[0].total_opposed == 0
+            assert summaries[1].total_supported == 1
+            assert summaries[1].total_opposed == 1
+            assert summaries[1].total_legislators == 2
+            
+            with open(output_dir / "session-b" / "bills.csv", 'r', encoding='utf-8') as f:
+                rows = list(csv.DictReader(f))
+                assert rows[0]['supporter_count'] == '1'
+                assert rows[0]['opposer_count'] == '1'
+                assert rows[0]['primary_sponsor'] == 'John Doe'
+            
+            assert (output_dir / "session-a" / "legislators-support-oppose-count.csv").exists()
+            
+            with open(output_dir / "summary.csv", 'r', encoding='utf-8') as f:
+                rows = list(csv.DictReader(f))
+                assert [row['name'] for row in rows] == ["session-a", "session-b"]
+    
+    def test_duplicate_dataset_names(self):
+        """Test that datasets sharing a directory name are rejected"""
+        with pytest.raises(ValueError):
+            run_batch(["a/session", "b/session"])
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 from main import main
 from repositories import LegislatorsRepository
 from models import Bill, Legislator, VoteResult, Vote, LegislatorVoteCount, BillVoteCount
@@ -40,7 +40,7 @@ class TestMain:
         mock_bills_count.return_value = mock_bill_counts
         
         # Execute main
-        main()
+        main([])
         
         # Verify repository methods were called
         mock_repo.get_all_bills.assert_called_once()
@@ -49,12 +49,14 @@ class TestMain:
         mock_repo.get_all_votes.assert_called_once()
         
         # Verify service functions were called with correct arguments
-        mock_legislators_count.assert_called_once_with(mock_legislators, mock_vote_results)
-        mock_bills_count.assert_called_once_with(mock_bills, mock_votes, mock_vote_results, mock_legislators)
+        mock_legislators_count.assert_called_once_with(mock_legislators, mock_vote_results, ANY)
+        mock_bills_count.assert_called_once_with(mock_bills, mock_votes, mock_vote_results, mock_legislators, ANY)
         
         # Verify save methods were called
-        mock_repo.save_legislator_vote_counts.assert_called_once_with(mock_legislator_counts)
-        mock_repo.save_bill_vote_counts.assert_called_once_with(mock_bill_counts)
+        mock_repo.save_legislator_vote_counts.assert_called_once_with(
+            mock_legislator_counts, "legislators-support-oppose-count.csv"
+        )
+        mock_repo.save_bill_vote_counts.assert_called_once_with(mock_bill_counts, "bills.csv")
     
     @patch('main.LegislatorsRepository')
     @patch('main.legislators_support_oppose_count')
@@ -81,7 +83,7 @@ class TestMain:
         mock_bills_count.return_value = []
         
         # Execute main
-        main()
+        main([])
         
         # Verify summary was printed
         print_calls = [str(call) for call in mock_print.call_args_list]
@@ -91,3 +93,69 @@ class TestMain:
         # Verify counts are displayed
         total_bills_printed = any("Total Bills: 2" in str(call) for call in print_calls)
         assert total_bills_printed, "Total bills count should be printed"
+        
+        # Every table is parsed for the default run, so no line counting happens
+        mock_repo.count_rows.assert_not_called()
+    
+    @patch('main.LegislatorsRepository')
+    @patch('builtins.print')
+    def test_main_sorted_output(self, mock_print, mock_repo_class):
+        """Test that --sort-by sorts the legislator and bill reports"""
+        mock_repo = Mock(spec=LegislatorsRepository)
+        mock_repo_class.return_value = mock_repo
+        
+        mock_repo.get_all_bills.return_value = [
+            Bill(id=2, title="Bill 2", sponsor_id=1),
+            Bill(id=1, title="Bill 1", sponsor_id=1)
+        ]
+        mock_repo.get_all_legislators.return_value = [Legislator(id=1, name="John Doe"), Legislator(id=2, name="Jane Smith")]
+        mock_repo.get_all_votes.return_value = [Vote(id=1, bill_id=1), Vote(id=2, bill_id=2)]
+        mock_repo.get_all_vote_results.return_value = [
+            VoteResult(id=1, legislator_id=2, vote_id=1, vote_type=1),
+            VoteResult(id=2, legislator_id=1, vote_id=1, vote_type=1),
+            VoteResult(id=3, legislator_id=1, vote_id=2, vote_type=1)
+        ]
+        
+        main(['--sort-by', 'supported', '--descending'])
+        
+        saved_legislators = list(mock_repo.save_legislator_vote_counts.call_args[0][0])
+        saved_bills = list(mock_repo.save_bill_vote_counts.call_args[0][0])
+        assert [count.id for count in saved_legislators] == [1, 2]
+        assert [count.id for count in saved_bills] == [1, 2]
+    
+    @patch('main.LegislatorsRepository')
+    @patch('builtins.print')
+    def test_main_legislators_report_only(self, mock_print, mock_repo_class):
+        """Test that the legislators report does not load bills or votes"""
+        mock_repo = Mock(spec=LegislatorsRepository)
+        mock_repo_class.return_value = mock_repo
+        mock_repo.count_rows.return_value = 5
+        mock_repo.get_all_legislators.return_value = [Legislator(id=1, name="John Doe")]
+        mock_repo.get_all_vote_results.return_value = [VoteResult(id=1, legislator_id=1, vote_id=1, vote_type=1)]
+        
+        main(['--report', 'legislators'])
+        
+        mock_repo.get_all_bills.assert_not_called()
+        mock_repo.get_all_votes.assert_not_called()
+        mock_repo.save_bill_vote_counts.assert_not_called()
+        counted_tables = sorted(call.args[0] for call in mock_repo.count_rows.call_args_list)
+        assert counted_tables == ['bills', 'votes']
+        assert any("Total Legislators: 1" in str(call) for call in mock_print.call_args_list)
+        saved = mock_repo.save_legislator_vote_counts.call_args[0][0]
+        assert saved == [LegislatorVoteCount(id=1, name="John Doe", num_supported_bills=1, num_opposed_bills=0)]
+    
+    @patch('main.LegislatorsRepository')
+    @patch('builtins.print')
+    def test_main_summary_only(self, mock_print, mock_repo_class):
+        """Test that the summary alone counts rows without loading any table"""
+        mock_repo = Mock(spec=LegislatorsRepository)
+        mock_repo_class.return_value = mock_repo
+        mock_repo.count_rows.return_value = 7
+        
+        main(['--report', 'summary'])
+        
+        mock_repo.get_all_bills.assert_not_called()
+        mock_repo.get_all_legislators.assert_not_called()
+        mock_repo.get_all_votes.assert_not_called()
+        mock_repo.get_all_vote_results.assert_not_called()
+        assert any("Total Vote Results: 7" in str(call) for call in mock_print.call_args_list)
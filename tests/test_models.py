@@ -0,0 +1,29 @@
+import pytest
+from models import Bill, Legislator, VoteResult, Vote, LegislatorVoteCount, BillVoteCount
+
+
+class TestRecords:
+    """Tests for the compact record models"""
+    
+    @pytest.mark.parametrize("record_class", [Bill, Legislator, VoteResult, Vote, LegislatorVoteCount, BillVoteCount])
+    def test_records_have_no_instance_dict(self, record_class):
+        """Test that records are stored in slots only"""
+        values = tuple(range(len(record_class.__slots__)))
+        record = record_class(*values)
+        
+        assert not hasattr(record, '__dict__')
+        with pytest.raises(AttributeError):
+            record.extra = 1
+    
+    def test_from_rows(self):
+        """Test building records in bulk from tuples"""
+        vote_results = VoteResult.from_rows(iter([(1, 10, 100, 1), (2, 20, 100, 2)]))
+        
+        assert vote_results == [
+            VoteResult(id=1, legislator_id=10, vote_id=100, vote_type=1),
+            VoteResult(id=2, legislator_id=20, vote_id=100, vote_type=2)
+        ]
+    
+    def test_from_rows_empty(self):
+        """Test building records from no rows"""
+        assert Bill.from_rows([]) == []
@@ -1,9 +1,10 @@
 import csv
+import json
 import tempfile
 import pytest
 from pathlib import Path
-from repositories import LegislatorsRepository
-from models import Bill, Legislator, VoteResult, Vote, LegislatorVoteCount, BillVoteCount
+from repositories import LegislatorsRepository, LazyDataset, SharedDataset
+from models import Bill, Legislator, VoteResult, Vote, LegislatorVoteCount, BillVoteCount, BillGroupVoteCount, VoteTypeCount
 
 
 class TestLegislatorsRepository:
@@ -93,6 +94,37 @@ class TestLegislatorsRepository:
             assert vote_results[0].vote_type == 1
             assert vote_results[1].vote_type == 2
     
+    def test_get_all_vote_results_column_order_and_blank_lines(self):
+        """Test reading vote results with reordered columns and blank lines"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_dir = Path(tmpdir) / "input"
+            input_dir.mkdir()
+            
+            vote_results_file = input_dir / "vote_results.csv"
+            with open(vote_results_file, 'w', newline='', encoding='utf-8') as f:
+                f.write("vote_type,vote_id,legislator_id,id\n2,100,10,1\n\n")
+            
+            repo = LegislatorsRepository(
+                datasets_path=tmpdir,
+                datasets_input_path=str(input_dir),
+                datasets_output_path=str(Path(tmpdir) / "output")
+            )
+            
+            vote_results = repo.get_all_vote_results()
+            
+            assert vote_results == [VoteResult(id=1, legislator_id=10, vote_id=100, vote_type=2)]
+    
+    def test_read_single_column_yields_tuples(self):
+        """Test that reading one column still yields 1-tuples"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_dir = Path(tmpdir) / "input"
+            input_dir.mkdir()
+            (input_dir / "votes.csv").write_text("id,bill_id\n10,1\n20,2\n", encoding='utf-8')
+            
+            repo = LegislatorsRepository(datasets_input_path=str(input_dir))
+            
+            assert list(repo._read_columns("votes.csv", ('bill_id',))) == [('1',), ('2',)]
+    
     def test_get_all_votes(self):
         """Test reading votes from CSV"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -198,3 +230,183 @@ class TestLegislatorsRepository:
                 assert rows[0]['primary_sponsor'] == 'John Doe'
                 assert rows[1]['id'] == '2'
                 assert rows[1]['title'] == 'Test Bill 2'
+    
+    def test_save_bill_group_vote_counts(self):
+        """Test saving bill group vote counts with the dimension as header"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir) / "output"
+            
+            repo = LegislatorsRepository(
+                datasets_path=tmpdir,
+                datasets_input_path=str(Path(tmpdir) / "input"),
+                datasets_output_path=str(output_dir)
+            )
+            
+            counts = [
+                BillGroupVoteCount(id=1, title="Test Bill 1", group="NY", supporter_count=3, opposer_count=1)
+            ]
+            
+            repo.save_bill_group_vote_counts(counts, "state", "bills-by-state.csv")
+            
+            with open(output_dir / "bills-by-state.csv", 'r', encoding='utf-8') as f:
+                rows = list(csv.DictReader(f))
+                
+                assert rows == [{
+                    'id': '1',
+                    'title': 'Test Bill 1',
+                    'state': 'NY',
+                    'supporter_count': '3',
+                    'opposer_count': '1'
+                }]
+    
+    def test_save_vote_type_counts(self):
+        """Test saving vote type counts with one column per label"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir) / "output"
+            
+            repo = LegislatorsRepository(
+                datasets_path=tmpdir,
+                datasets_input_path=str(Path(tmpdir) / "input"),
+                datasets_output_path=str(output_dir)
+            )
+            
+            counts = [VoteTypeCount(id=1, name="Test Bill 1", counts=[3, 1, 2])]
+            
+            repo.save_vote_type_counts(counts, ['support', 'oppose', 'abstain'], "bills-vote-types.csv", name_field="title")
+            
+            with open(output_dir / "bills-vote-types.csv", 'r', encoding='utf-8') as f:
+                rows = list(csv.DictReader(f))
+                
+                assert rows == [{'id': '1', 'title': 'Test Bill 1', 'support': '3', 'oppose': '1', 'abstain': '2'}]
+    
+    def test_save_partitioned(self):
+        """Test size-bounded partition files and their manifest"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir) / "output"
+            
+            repo = LegislatorsRepository(
+                datasets_path=tmpdir,
+                datasets_input_path=str(Path(tmpdir) / "input"),
+                datasets_output_path=str(output_dir)
+            )
+            
+            vote_counts = (
+                LegislatorVoteCount(id=i, name=f"Legislator {i}", num_supported_bills=i, num_opposed_bills=0)
+                for i in range(1, 6)
+            )
+            
+            # Partitions left by an earlier, larger run
+            output_dir.mkdir()
+            for stale in ("legislators-part-00003.csv", "legislators-part-00004.csv"):
+                (output_dir / stale).write_text("id\n", encoding='utf-8')
+            (output_dir / "bills-part-00003.csv").write_text("id\n", encoding='utf-8')
+            
+            files = repo.save_partitioned(
+                repo.save_legislator_vote_counts, vote_counts, "legislators.csv", 2, sort_key='id'
+            )
+            
+            assert files == ["legislators-part-00000.csv", "legislators-part-00001.csv", "legislators-part-00002.csv"]
+            assert sorted(path.name for path in output_dir.glob("legislators-part-*")) == files
+            assert (output_dir / "bills-part-00003.csv").exists()
+            with open(output_dir / "legislators-part-00002.csv", 'r', encoding='utf-8') as f:
+                rows = list(csv.DictReader(f))
+                assert [row['id'] for row in rows] == ['5']
+            
+            with open(output_dir / "legislators.manifest.json", 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+                assert manifest['total_rows'] == 5
+                assert manifest['sort_key'] == 'id'
+                assert manifest['partitions'][1] == {
+                    'file': "legislators-part-00001.csv", 'rows': 2, 'first': 3, 'last': 4
+                }
+    
+    def test_count_rows(self):
+        """Test counting data rows without parsing, with and without a final newline"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_dir = Path(tmpdir) / "input"
+            input_dir.mkdir()
+            
+            (input_dir / "votes.csv").write_bytes(b"id,bill_id\r\n1,10\r\n\r\n\r\n2,20\r\n\r\n")
+            (input_dir / "legislators.csv").write_bytes(b"id,name\n1,John Doe\n2,Jane Smith")
+            (input_dir / "bills.csv").write_bytes(b"")
+            (input_dir / "vote_results.csv").write_bytes(b"id,legislator_id,vote_id,vote_type\n")
+            
+            repo = LegislatorsRepository(datasets_input_path=str(input_dir))
+            
+            assert repo.count_rows('votes') == 2
+            assert repo.count_rows('votes') == len(repo.get_all_votes())
+            assert repo.count_rows('legislators') == 2
+            assert repo.count_rows('bills') == 0
+            assert repo.count_rows('vote_results') == 0
+            with pytest.raises(ValueError):
+                repo.count_rows('sponsors')
+
+
+class TestLazyDataset:
+    """Tests for LazyDataset"""
+    
+    def test_loads_tables_once_on_access(self):
+        """Test that tables are read on first access only and counted otherwise"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_dir = Path(tmpdir) / "input"
+            input_dir.mkdir()
+            (input_dir / "votes.csv").write_text("id,bill_id\n1,10\n2,20\n", encoding='utf-8')
+            
+            dataset = LazyDataset(LegislatorsRepository(datasets_input_path=str(input_dir)))
+            
+            assert dataset.row_count('votes') == 2
+            assert not dataset.is_loaded('votes')
+            
+            votes = dataset.votes
+            
+            assert votes == [Vote(id=1, bill_id=10), Vote(id=2, bill_id=20)]
+            assert dataset.is_loaded('votes')
+            assert dataset.votes is votes
+            assert dataset.row_count('votes') == 2
+
+
+class TestSharedDataset:
+    """Tests for SharedDataset"""
+    
+    def test_attach_reads_vote_result_columns(self):
+        """Test that an attached handle sees the columns written by the owner"""
+        vote_results = [
+            VoteResult(id=1, legislator_id=10, vote_id=100, vote_type=1),
+            VoteResult(id=2, legislator_id=20, vote_id=100, vote_type=2),
+            VoteResult(id=3, legislator_id=30, vote_id=200, vote_type=1)
+        ]
+        
+        with SharedDataset.from_vote_results(vote_results) as dataset:
+            attached = SharedDataset.attach(dataset.descriptor)
+            try:
+                assert len(attached) == 3
+                assert list(attached.column('legislator_id')) == [10, 20, 30]
+                assert list(attached.column('vote_id', 1)) == [100, 200]
+                assert list(attached.column('vote_type', 0, 2)) == [1, 2]
+                assert list(attached.column('id', 5)) == []
+            finally:
+                attached.close()
+    
+    def test_descriptor_read_columns(self):
+        """Test calling a function with views of a row range through the descriptor"""
+        with SharedDataset.create({'vote_id': [1, 2, 3], 'bill_id': [7, 8, 9]}) as dataset:
+            assert dataset.descriptor.num_rows == 3
+            pairs = dataset.descriptor.read_columns(
+                ('bill_id', 'vote_id'),
+                lambda bill_ids, vote_ids: list(zip(bill_ids, vote_ids)),
+                1
+            )
+        
+        assert pairs == [(8, 2), (9, 3)]
+    
+    def test_columns_of_different_lengths(self):
+        """Test a dataset holding columns of several tables"""
+        with SharedDataset.create({'vote_id': [1, 2], 'bill_id': [7, 8, 9]}) as dataset:
+            assert list(dataset.column('vote_id')) == [1, 2]
+            assert list(dataset.column('bill_id')) == [7, 8, 9]
+    
+    def test_empty_dataset(self):
+        """Test sharing empty columns"""
+        with SharedDataset.from_vote_results([]) as dataset:
+            assert len(dataset) == 0
+            assert list(dataset.column('vote_type')) == []
@@ -1,6 +1,20 @@
+from functools import partial
+
 import pytest
-from services import legislators_support_oppose_count, bills_support_oppose_count
-from models import Legislator, VoteResult, Bill, Vote, LegislatorVoteCount, BillVoteCount
+from services import (
+    legislators_support_oppose_count,
+    bills_support_oppose_count,
+    bills_support_oppose_count_by_group,
+    LegislatorGroups,
+    parse_legislator_attributes,
+    validate_dataset,
+    VoteTypeHistograms,
+    count_shared_vote_types,
+    parallel_vote_type_histograms,
+    sort_report
+)
+from repositories import SharedDataset
+from models import Legislator, VoteResult, Bill, Vote, LegislatorVoteCount, BillVoteCount, LegislatorAttributes
 
 
 class TestLegislatorsSupportOpposeCount:
@@ -143,3 +157,350 @@ class TestBillsSupportOpposeCount:
         
         assert len(result) == 1
         assert result[0].primary_sponsor == "Unknown"
+
+
+class TestLegislatorGroups:
+    """Tests for legislator attribute parsing and group encoding"""
+    
+    def test_parse_representative(self):
+        """Test parsing party, state and district of a representative"""
+        attributes = parse_legislator_attributes(Legislator(id=1, name="Rep. Don Bacon (R-NE-2)"))
+        
+        assert attributes == LegislatorAttributes(id=1, party="R", state="NE", district="2")
+    
+    def test_parse_senator_and_unparseable_name(self):
+        """Test parsing a name without district and a name without suffix"""
+        senator = parse_legislator_attributes(Legislator(id=1, name="Sen. Bernie Sanders (I-VT)"))
+        unknown = parse_legislator_attributes(Legislator(id=2, name="John Doe"))
+        
+        assert (senator.party, senator.state, senator.district) == ("I", "VT", "")
+        assert (unknown.party, unknown.state) == ("Unknown", "Unknown")
+    
+    def test_parse_unusual_district(self):
+        """Test that an unusual district keeps the party and state"""
+        at_large = parse_legislator_attributes(Legislator(id=1, name="Del. Eleanor Norton (D-DC-At Large)"))
+        
+        assert at_large == LegislatorAttributes(id=1, party="D", state="DC", district="At Large")
+    
+    def test_group_codes(self):
+        """Test that codes index the sorted labels"""
+        groups = LegislatorGroups.from_legislators([
+            Legislator(id=1, name="Rep. A (R-NY-1)"),
+            Legislator(id=2, name="Rep. B (D-CA-2)"),
+            Legislator(id=3, name="Rep. C (D-NY-3)")
+        ])
+        
+        assert groups.labels('party') == ["D", "R", "Unknown"]
+        assert groups.codes('party') == {1: 1, 2: 0, 3: 0}
+        assert groups.labels('state') == ["CA", "NY", "Unknown"]
+        assert groups.unknown_code('state') == 2
+
+
+class TestBillsSupportOpposeCountByGroup:
+    """Tests for bills_support_oppose_count_by_group service"""
+    
+    def setup_method(self):
+        self.bills = [Bill(id=1, title="Bill 1", sponsor_id=1), Bill(id=2, title="Bill 2", sponsor_id=2)]
+        self.votes = [Vote(id=10, bill_id=1), Vote(id=20, bill_id=2), Vote(id=30, bill_id=999)]
+        self.vote_results = [
+            VoteResult(id=1, legislator_id=1, vote_id=10, vote_type=1),
+            VoteResult(id=2, legislator_id=2, vote_id=10, vote_type=2),
+            VoteResult(id=3, legislator_id=3, vote_id=10, vote_type=1),
+            VoteResult(id=4, legislator_id=99, vote_id=20, vote_type=2),  # unknown legislator
+            VoteResult(id=5, legislator_id=1, vote_id=20, vote_type=3),  # ignored vote type
+            VoteResult(id=6, legislator_id=1, vote_id=30, vote_type=1),  # vote of unknown bill
+        ]
+        self.groups = LegislatorGroups.from_legislators([
+            Legislator(id=1, name="Rep. A (R-NY-1)"),
+            Legislator(id=2, name="Rep. B (D-CA-2)"),
+            Legislator(id=3, name="Rep. C (D-NY-3)")
+        ])
+    
+    def test_count_by_party(self):
+        """Test party-line breakdown per bill"""
+        result = bills_support_oppose_count_by_group(
+            self.bills, self.votes, self.vote_results, self.groups, 'party'
+        )
+        
+        assert [(r.id, r.group, r.supporter_count, r.opposer_count) for r in result] == [
+            (1, "D", 1, 1),
+            (1, "R", 1, 0),
+            (2, "Unknown", 0, 1)
+        ]
+        assert result[0].title == "Bill 1"
+    
+    def test_count_by_state(self):
+        """Test per-state breakdown per bill"""
+        result = bills_support_oppose_count_by_group(
+            self.bills, self.votes, self.vote_results, self.groups, 'state'
+        )
+        
+        assert [(r.id, r.group, r.supporter_count, r.opposer_count) for r in result] == [
+            (1, "CA", 0, 1),
+            (1, "NY", 2, 0),
+            (2, "Unknown", 0, 1)
+        ]
+    
+    def test_views_of_shared_histograms(self):
+        """Test that every dimension is a view of histograms counted once with the groups"""
+        histograms = VoteTypeHistograms.from_vote_results(
+            self.vote_results, self.votes, self.bills, self.groups
+        )
+        
+        for dimension in ('party', 'state'):
+            assert bills_support_oppose_count_by_group(
+                self.bills, self.votes, [], self.groups, dimension, histograms
+            ) == bills_support_oppose_count_by_group(
+                self.bills, self.votes, self.vote_results, self.groups, dimension
+            )
+
+
+class TestValidateDataset:
+    """Tests for validate_dataset service"""
+    
+    def test_valid_dataset(self):
+        """Test that consistent tables produce an empty report"""
+        report = validate_dataset(
+            [Bill(id=1, title="Bill 1", sponsor_id=1)],
+            [Legislator(id=1, name="John Doe")],
+            [Vote(id=10, bill_id=1)],
+            [VoteResult(id=1, legislator_id=1, vote_id=10, vote_type=1)]
+        )
+        
+        assert report.is_valid
+        assert report.orphan_vote_results == []
+    
+    def test_flags_every_issue(self):
+        """Test that each kind of integrity issue is reported"""
+        bills = [Bill(id=1, title="Bill 1", sponsor_id=999)]
+        legislators = [Legislator(id=1, name="John Doe")]
+        votes = [Vote(id=10, bill_id=1), Vote(id=20, bill_id=2)]
+        vote_results = [
+            VoteResult(id=1, legislator_id=1, vote_id=10, vote_type=1),
+            VoteResult(id=1, legislator_id=1, vote_id=20, vote_type=2),   # duplicate id
+            VoteResult(id=2, legislator_id=7, vote_id=30, vote_type=1),   # unknown legislator, orphan
+            VoteResult(id=3, legislator_id=7, vote_id=10, vote_type=9),   # invalid vote type
+        ]
+        
+        report = validate_dataset(bills, legislators, votes, vote_results)
+        
+        assert not report.is_valid
+        assert report.orphan_votes == [20]
+        assert report.orphan_vote_results == [2]
+        assert report.unknown_legislators == [7]
+        assert report.unknown_sponsors == [999]
+        assert report.duplicate_vote_result_ids == [1]
+        assert report.invalid_vote_types == [3]
+    
+    def test_reuses_report_histograms(self):
+        """Test validation over the histograms counted for the bill reports"""
+        bills = [Bill(id=1, title="Bill 1", sponsor_id=1)]
+        legislators = [Legislator(id=1, name="Rep. A (R-NY-1)")]
+        votes = [Vote(id=10, bill_id=1), Vote(id=20, bill_id=2)]
+        vote_results = [
+            VoteResult(id=1, legislator_id=1, vote_id=10, vote_type=1),
+            VoteResult(id=2, legislator_id=1, vote_id=20, vote_type=1),   # vote of orphan vote, not an orphan result
+            VoteResult(id=3, legislator_id=7, vote_id=30, vote_type=42),  # unknown legislator, orphan, invalid type
+        ]
+        histograms = VoteTypeHistograms.from_vote_results(
+            vote_results, votes, bills, LegislatorGroups.from_legislators(legislators)
+        )
+        
+        report = validate_dataset(bills, legislators, votes, vote_results, histograms)
+        
+        assert report == validate_dataset(bills, legislators, votes, vote_results)
+        assert report.orphan_votes == [20]
+        assert report.orphan_vote_results == [3]
+        assert report.unknown_legislators == [7]
+        assert report.invalid_vote_types == [3]
+        assert report.duplicate_vote_result_ids == []
+
+
+class TestVoteTypeHistograms:
+    """Tests for the VoteTypeHistograms engine"""
+    
+    def setup_method(self):
+        self.bills = [Bill(id=1, title="Bill 1", sponsor_id=1), Bill(id=2, title="Bill 2", sponsor_id=2)]
+        self.votes = [Vote(id=10, bill_id=1), Vote(id=20, bill_id=2)]
+        self.vote_results = [
+            VoteResult(id=1, legislator_id=2, vote_id=10, vote_type=1),   # support
+            VoteResult(id=2, legislator_id=1, vote_id=10, vote_type=3),   # abstain
+            VoteResult(id=3, legislator_id=2, vote_id=20, vote_type=5),   # not voting
+            VoteResult(id=4, legislator_id=1, vote_id=20, vote_type=42),  # unrecognized code
+            VoteResult(id=5, legislator_id=1, vote_id=99, vote_type=2),   # vote of unknown bill
+        ]
+        self.legislators = [Legislator(id=1, name="John Doe"), Legislator(id=2, name="Jane Smith")]
+    
+    def test_labels(self):
+        """Test one column per known vote type plus other"""
+        assert VoteTypeHistograms.labels == ['support', 'oppose', 'abstain', 'present', 'not_voting', 'other']
+    
+    def test_single_pass_matrices(self):
+        """Test legislator and bill matrices keep every vote type"""
+        histograms = VoteTypeHistograms.from_vote_results(self.vote_results, self.votes, self.bills)
+        
+        assert histograms.legislator_ids == [2, 1]
+        assert histograms.legislator_row(0) == [1, 0, 0, 0, 1, 0]
+        assert histograms.legislator_row(1) == [0, 1, 1, 0, 0, 1]
+        assert histograms.bill_ids == [1, 2]
+        assert histograms.bill_row(0) == [1, 0, 1, 0, 0, 0]
+        assert histograms.bill_row(1) == [0, 0, 0, 0, 1, 1]
+    
+    def test_from_columns_matches_from_vote_results(self):
+        """Test that counting columns gives the same matrices as counting records"""
+        from_records = VoteTypeHistograms.from_vote_results(self.vote_results, self.votes, self.bills)
+        from_columns = VoteTypeHistograms.from_columns(
+            [vote_result.legislator_id for vote_result in self.vote_results],
+            [vote_result.vote_id for vote_result in self.vote_results],
+            [vote_result.vote_type for vote_result in self.vote_results],
+            self.votes,
+            self.bills
+        )
+        
+        assert from_columns.legislator_ids == from_records.legislator_ids
+        assert from_columns.legislator_counts == from_records.legislator_counts
+        assert from_columns.bill_counts == from_records.bill_counts
+    
+    def test_derived_views(self):
+        """Test support/oppose and full vote type views of the matrices"""
+        histograms = VoteTypeHistograms.from_vote_results(self.vote_results, self.votes, self.bills)
+        
+        assert histograms.legislator_vote_counts(self.legislators) == [
+            LegislatorVoteCount(id=2, name="Jane Smith", num_supported_bills=1, num_opposed_bills=0),
+            LegislatorVoteCount(id=1, name="John Doe", num_supported_bills=0, num_opposed_bills=1)
+        ]
+        assert histograms.bill_vote_counts(self.bills, self.legislators)[0] == BillVoteCount(
+            id=1, title="Bill 1", supporter_count=1, opposer_count=0, primary_sponsor="John Doe"
+        )
+        
+        bill_vote_types = histograms.bill_vote_type_counts(self.bills)
+        assert bill_vote_types[1].name == "Bill 2"
+        assert bill_vote_types[1].counts == [0, 0, 0, 0, 1, 1]
+    
+    def test_bill_group_counts_keep_every_vote_type(self):
+        """Test per-party and per-state bill matrices counted in the same pass"""
+        groups = LegislatorGroups.from_legislators([
+            Legislator(id=1, name="Rep. A (R-NY-1)"),
+            Legislator(id=2, name="Rep. B (D-NY-2)")
+        ])
+        histograms = VoteTypeHistograms.from_vote_results(self.vote_results, self.votes, self.bills, groups)
+        
+        # party labels: D, R, Unknown
+        party_counts = histograms.bill_group_counts('party')
+        assert party_counts[0:6] == [1, 0, 0, 0, 0, 0]      # bill 1, D
+        assert party_counts[6:12] == [0, 0, 1, 0, 0, 0]     # bill 1, R
+        assert party_counts[18:24] == [0, 0, 0, 0, 1, 0]    # bill 2, D
+        assert party_counts[24:30] == [0, 0, 0, 0, 0, 1]    # bill 2, R
+        # state labels: NY, Unknown
+        state_counts = histograms.bill_group_counts('state')
+        assert state_counts[0:6] == [1, 0, 1, 0, 0, 0]
+        assert state_counts[12:18] == [0, 0, 0, 0, 1, 1]
+        assert histograms.bill_counts == VoteTypeHistograms.from_vote_results(
+            self.vote_results, self.votes, self.bills
+        ).bill_counts
+    
+    def test_merge_keeps_group_cells(self):
+        """Test that merging shard histograms keeps the per-group matrices"""
+        groups = LegislatorGroups.from_legislators([Legislator(id=1, name="Rep. A (R-NY-1)")])
+        expected = VoteTypeHistograms.from_vote_results(self.vote_results, self.votes, self.bills, groups)
+        
+        merged = VoteTypeHistograms.merge([
+            VoteTypeHistograms.from_vote_results(self.vote_results[:2], self.votes, self.bills, groups),
+            VoteTypeHistograms.from_vote_results(self.vote_results[2:], self.votes, self.bills, groups)
+        ])
+        
+        assert merged.bill_counts == expected.bill_counts
+        assert merged.bill_group_counts('party') == expected.bill_group_counts('party')
+    
+    def test_bill_group_counts_without_groups(self):
+        """Test that group views need histograms counted with groups"""
+        histograms = VoteTypeHistograms.from_vote_results(self.vote_results, self.votes, self.bills)
+        
+        with pytest.raises(ValueError):
+            histograms.bill_group_counts('party')
+    
+    def test_bill_vote_counts_without_bill_matrix(self):
+        """Test that asking for bills the histograms were not built with is a clear error"""
+        histograms = VoteTypeHistograms.from_vote_results(self.vote_results)
+        
+        with pytest.raises(ValueError, match="Bill 1 is not in the bill matrix"):
+            bills_support_oppose_count(self.bills, self.votes, self.vote_results, self.legislators, histograms)
+
+
+class TestSharedAggregation:
+    """Tests for aggregation over a SharedDataset"""
+    
+    def setup_method(self):
+        self.bills = [Bill(id=1, title="Bill 1", sponsor_id=1), Bill(id=2, title="Bill 2", sponsor_id=2)]
+        self.votes = [Vote(id=10, bill_id=1), Vote(id=20, bill_id=2)]
+        self.vote_results = [
+            VoteResult(id=i, legislator_id=i % 3, vote_id=10 if i % 2 else 20, vote_type=1 + i % 4)
+            for i in range(25)
+        ]
+        self.expected = VoteTypeHistograms.from_vote_results(self.vote_results, self.votes, self.bills)
+    
+    def test_count_shared_vote_types(self):
+        """Test counting straight over the shared columns"""
+        with SharedDataset.from_vote_results(self.vote_results) as dataset:
+            histograms = dataset.descriptor.read_columns(
+                ('legislator_id', 'vote_id', 'vote_type'),
+                partial(count_shared_vote_types, votes=self.votes, bills=self.bills)
+            )
+        
+        assert histograms.legislator_ids == self.expected.legislator_ids
+        assert histograms.legislator_counts == self.expected.legislator_counts
+        assert histograms.bill_counts == self.expected.bill_counts
+    
+    def test_merge_shards(self):
+        """Test that merging shard histograms matches a single pass"""
+        with SharedDataset.from_vote_results(self.vote_results) as dataset:
+            count = partial(count_shared_vote_types, votes=self.votes, bills=self.bills)
+            parts = [
+                dataset.descriptor.read_columns(('legislator_id', 'vote_id', 'vote_type'), count, start, start + 7)
+                for start in range(0, 25, 7)
+            ]
+        
+        merged = VoteTypeHistograms.merge(parts)
+        
+        assert merged.legislator_ids == self.expected.legislator_ids
+        assert merged.legislator_counts == self.expected.legislator_counts
+        assert merged.bill_counts == self.expected.bill_counts
+    
+    def test_parallel_vote_type_histograms(self):
+        """Test counting shards in a process pool"""
+        with SharedDataset.from_vote_results(self.vote_results) as dataset:
+            histograms = parallel_vote_type_histograms(dataset.descriptor, self.votes, self.bills, workers=3)
+        
+        assert histograms.legislator_vote_counts([]) == self.expected.legislator_vote_counts([])
+        assert histograms.bill_counts == self.expected.bill_counts
+
+
+class TestReportSorting:
+    """Tests for sorted report output"""
+    
+    def setup_method(self):
+        self.counts = [
+            LegislatorVoteCount(id=3, name="C", num_supported_bills=1, num_opposed_bills=0),
+            LegislatorVoteCount(id=1, name="A", num_supported_bills=2, num_opposed_bills=4),
+            LegislatorVoteCount(id=5, name="E", num_supported_bills=1, num_opposed_bills=2),
+            LegislatorVoteCount(id=2, name="B", num_supported_bills=3, num_opposed_bills=1),
+            LegislatorVoteCount(id=4, name="D", num_supported_bills=1, num_opposed_bills=3),
+        ]
+    
+    def test_sort_by_id(self):
+        """Test sorting by id"""
+        result = sort_report(self.counts, 'id')
+        
+        assert [count.id for count in result] == [1, 2, 3, 4, 5]
+    
+    def test_sort_by_count_breaks_ties_by_id(self):
+        """Test sorting by a count column with ties broken by id"""
+        ascending = sort_report(self.counts, 'num_supported_bills')
+        descending = sort_report(self.counts, 'num_supported_bills', reverse=True)
+        
+        assert [count.id for count in ascending] == [3, 4, 5, 1, 2]
+        assert [count.id for count in descending] == [2, 1, 5, 4, 3]
+    
+    def test_sort_empty_report(self):
+        """Test sorting no records"""
+        assert list(sort_report([], 'id')) == []